@@ -51,7 +51,8 @@ class MarkdownReportBuilder:
         Returns:
             Dict with path to generated report file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        generated_at = datetime.now()
+        timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
 
         # Determine data source directories
         if job_id:
@@ -76,7 +77,8 @@ class MarkdownReportBuilder:
             heuristic_config=heuristic_config,
             performance=performance,
             inhibition=inhibition,
-            precipitation=precipitation
+            precipitation=precipitation,
+            generated_at=generated_at
         )
 
         # Generate markdown content
@@ -119,12 +121,15 @@ class MarkdownReportBuilder:
         heuristic_config: Dict,
         performance: Dict,
         inhibition: Dict,
-        precipitation: Dict
+        precipitation: Dict,
+        generated_at: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """Prepare template context from all data sources."""
+        if generated_at is None:
+            generated_at = datetime.now()
         context = {
-            'timestamp': datetime.now().isoformat(),
-            'timestamp_readable': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': generated_at.isoformat(),
+            'timestamp_readable': generated_at.strftime('%Y-%m-%d %H:%M:%S'),
             'status': 'draft'
         }
 
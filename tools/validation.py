@@ -12,6 +12,18 @@ logger = logging.getLogger(__name__)
 logger.info("Using QSDsan validation via CLI instructions (FastMCP-compatible)")
 
 
+def _clean_adm1_state(adm1_state: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """Flatten [value, unit, description] and {'value': ...} entries to floats."""
+    clean_state = {}
+    for key, value in adm1_state.items():
+        if isinstance(value, list) and value:
+            value = value[0]
+        elif isinstance(value, dict) and 'value' in value:
+            value = value['value']
+        clean_state[key] = to_float(value)
+    return clean_state
+
+
 async def validate_adm1_state(
     adm1_state: Dict[str, Any],
     user_parameters: Dict[str, float],
@@ -36,14 +48,7 @@ async def validate_adm1_state(
         user_parameters = coerce_to_dict(user_parameters) or {}
 
         # Clean ADM1 state - handle [value, unit, description] format
-        clean_state = {}
-        for key, value in adm1_state.items():
-            if isinstance(value, list) and len(value) > 0:
-                clean_state[key] = to_float(value[0])
-            elif isinstance(value, dict) and 'value' in value:
-                clean_state[key] = to_float(value['value'])
-            else:
-                clean_state[key] = to_float(value)
+        clean_state = _clean_adm1_state(adm1_state)
 
         # Get temperature
         temp_c = user_parameters.get('temperature_c', 35.0)
@@ -130,14 +135,7 @@ async def compute_bulk_composites(
         adm1_state = coerce_to_dict(adm1_state) or {}
 
         # Clean state - handle multiple input formats
-        clean_state = {}
-        for key, value in adm1_state.items():
-            if isinstance(value, list) and len(value) > 0:
-                clean_state[key] = to_float(value[0])
-            elif isinstance(value, dict) and 'value' in value:
-                clean_state[key] = to_float(value['value'])
-            else:
-                clean_state[key] = to_float(value)
+        clean_state = _clean_adm1_state(adm1_state)
 
         # Save cleaned ADM1 state
         adm1_file = Path('./adm1_state_cleaned.json')
@@ -199,14 +197,7 @@ async def check_strong_ion_balance(
         adm1_state = coerce_to_dict(adm1_state) or {}
 
         # Clean state - handle multiple input formats
-        clean_state = {}
-        for key, value in adm1_state.items():
-            if isinstance(value, list) and len(value) > 0:
-                clean_state[key] = to_float(value[0])
-            elif isinstance(value, dict) and 'value' in value:
-                clean_state[key] = to_float(value['value'])
-            else:
-                clean_state[key] = to_float(value)
+        clean_state = _clean_adm1_state(adm1_state)
 
         # Save cleaned ADM1 state
         adm1_file = Path('./adm1_state_cleaned.json')
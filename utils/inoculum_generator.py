@@ -36,12 +36,19 @@ BIOMASS_COMPONENTS = [
     "X_c4SRB",   # C4-utilizing SRB
 ]
 
+# Methanogens receive the additional inoculum boost
+METHANOGEN_COMPONENTS = frozenset(("X_ac", "X_h2"))
+
 # Organic substrate components (for COD calculation)
 ORGANIC_SUBSTRATES = [
     "S_su", "S_aa", "S_fa", "S_va", "S_bu", "S_pro", "S_ac",  # Solubles
     "X_ch", "X_pr", "X_li",  # Particulate organics
 ]
 
+# Every component counted by calculate_cod_from_organics, in summation order:
+# substrates, biomass, then particulate and soluble inerts
+_COD_COMPONENTS = tuple(ORGANIC_SUBSTRATES) + tuple(BIOMASS_COMPONENTS) + ("X_I", "S_I")
+
 # NOTE: In mADM1/QSDsan, ALL state variables (both S_* and X_*) are already
 # expressed in COD units (kg COD/m³), NOT VSS. Therefore, we do NOT apply
 # a COD conversion factor when calculating COD from biomass components.
@@ -61,26 +68,13 @@ def calculate_cod_from_organics(state: Dict[str, float]) -> float:
     Returns:
         Total organic COD in kg COD/m³
     """
+    # Substrates, biomass and inerts are all already in COD units - NO conversion
+    # needed. Soluble inerts are included because they affect the F/M ratio.
     cod_kg_m3 = 0.0
-
-    # Sum all organic substrates (already in COD units)
-    for component in ORGANIC_SUBSTRATES:
+    for component in _COD_COMPONENTS:
         if component in state:
             cod_kg_m3 += state[component]
 
-    # Add biomass COD (already in COD units - NO conversion needed)
-    for component in BIOMASS_COMPONENTS:
-        if component in state:
-            cod_kg_m3 += state[component]
-
-    # Add particulate inerts as COD
-    if "X_I" in state:
-        cod_kg_m3 += state["X_I"]
-
-    # Add soluble inerts as COD (affects F/M ratio)
-    if "S_I" in state:
-        cod_kg_m3 += state["S_I"]
-
     return cod_kg_m3
 
 
@@ -208,7 +202,7 @@ def generate_inoculum_state(
             scaled_value = original_value * scaling_factor
 
             # Apply additional boost to methanogens (X_ac, X_h2)
-            if component in ["X_ac", "X_h2"]:
+            if component in METHANOGEN_COMPONENTS:
                 scaled_value *= methanogen_boost_factor
                 logger.debug(
                     f"  {component}: {original_value:.4f} → {scaled_value:.4f} kg/m³ "
@@ -241,38 +235,37 @@ def generate_inoculum_state(
     original_s_na = inoculum_state.get("S_Na", 0.20)
     inoculum_state["S_Na"] = original_s_na + na_increase_kg_m3
 
-    logger.info("="*80)
-    logger.info("ALKALINITY BOOST & ION BALANCE")
-    logger.info(f"  S_IC (inorganic carbon): {original_s_ic:.2f} → {target_s_ic_kg_m3:.2f} kg/m³")
-    logger.info(f"  Equivalent alkalinity: {original_alkalinity_meq_l:.0f} → {target_alkalinity_meq_l:.0f} meq/L")
-    alkalinity_boost_factor = (target_s_ic_kg_m3/original_s_ic) if original_s_ic > 0.01 else float('inf')
-    logger.info(f"  Alkalinity boost: {alkalinity_boost_factor:.1f}× increase" if alkalinity_boost_factor < 1000 else f"  Alkalinity boost: Initial alkalinity near zero, set to {target_s_ic_kg_m3:.2f} kg/m³")
-    logger.info(f"  S_Na (sodium cation): {original_s_na:.3f} → {inoculum_state['S_Na']:.3f} kg/m³")
-    logger.info(f"  Na+ added: {na_increase_kg_m3:.3f} kg/m³ ({alkalinity_increase_meq_l:.0f} meq/L)")
-    logger.info(f"  Ion balance: HCO3- increase = Na+ increase (electroneutrality maintained)")
-    logger.info("="*80)
-
-    # Log critical methanogen components
-    logger.info(f"Critical methanogen concentrations (with {methanogen_boost_factor:.1f}× boost):")
-    logger.info(f"  X_ac (acetoclastic): {inoculum_state.get('X_ac', 0):.2f} kg/m³ "
-                f"(was {feedstock_state.get('X_ac', 0):.2f}, {inoculum_state.get('X_ac', 0)/feedstock_state.get('X_ac', 1):.1f}×)")
-    logger.info(f"  X_h2 (hydrogenotrophic): {inoculum_state.get('X_h2', 0):.2f} kg/m³ "
-                f"(was {feedstock_state.get('X_h2', 0):.2f}, {inoculum_state.get('X_h2', 0)/feedstock_state.get('X_h2', 1):.1f}×)")
-
-    # Calculate total biomass COD for reporting
+    # Startup report only: skip the ratio arithmetic and formatting when INFO is off
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("="*80)
+        logger.info("ALKALINITY BOOST & ION BALANCE")
+        logger.info(f"  S_IC (inorganic carbon): {original_s_ic:.2f} → {target_s_ic_kg_m3:.2f} kg/m³")
+        logger.info(f"  Equivalent alkalinity: {original_alkalinity_meq_l:.0f} → {target_alkalinity_meq_l:.0f} meq/L")
+        alkalinity_boost_factor = (target_s_ic_kg_m3/original_s_ic) if original_s_ic > 0.01 else float('inf')
+        logger.info(f"  Alkalinity boost: {alkalinity_boost_factor:.1f}× increase" if alkalinity_boost_factor < 1000 else f"  Alkalinity boost: Initial alkalinity near zero, set to {target_s_ic_kg_m3:.2f} kg/m³")
+        logger.info(f"  S_Na (sodium cation): {original_s_na:.3f} → {inoculum_state['S_Na']:.3f} kg/m³")
+        logger.info(f"  Na+ added: {na_increase_kg_m3:.3f} kg/m³ ({alkalinity_increase_meq_l:.0f} meq/L)")
+        logger.info(f"  Ion balance: HCO3- increase = Na+ increase (electroneutrality maintained)")
+        logger.info("="*80)
+
+        # Log critical methanogen components
+        logger.info(f"Critical methanogen concentrations (with {methanogen_boost_factor:.1f}× boost):")
+        logger.info(f"  X_ac (acetoclastic): {inoculum_state.get('X_ac', 0):.2f} kg/m³ "
+                    f"(was {feedstock_state.get('X_ac', 0):.2f}, {inoculum_state.get('X_ac', 0)/feedstock_state.get('X_ac', 1):.1f}×)")
+        logger.info(f"  X_h2 (hydrogenotrophic): {inoculum_state.get('X_h2', 0):.2f} kg/m³ "
+                    f"(was {feedstock_state.get('X_h2', 0):.2f}, {inoculum_state.get('X_h2', 0)/feedstock_state.get('X_h2', 1):.1f}×)")
+
+    # Calculate total biomass COD for reporting (also serves as the verification total)
     # NOTE: In mADM1, biomass components are in COD units, NOT VSS
     # To convert to VSS: divide by 1.42 g COD/g VSS
-    total_biomass_cod = sum([
-        inoculum_state.get(comp, 0) for comp in BIOMASS_COMPONENTS
-    ])
+    total_biomass_cod = calculate_current_biomass_cod(inoculum_state)
     total_biomass_vss_kg_m3 = total_biomass_cod / 1.42  # Convert COD to VSS
     logger.info(f"Total inoculum biomass: {total_biomass_cod:.2f} kg COD/m³ "
                 f"= {total_biomass_vss_kg_m3:.2f} kg VSS/m³ "
                 f"= {total_biomass_vss_kg_m3 * 1000:.0f} mg VSS/L")
 
     # Verify target was achieved
-    final_biomass_cod = calculate_current_biomass_cod(inoculum_state)
-    logger.info(f"Verification: Final biomass COD = {final_biomass_cod:.1f} kg/m³ "
+    logger.info(f"Verification: Final biomass COD = {total_biomass_cod:.1f} kg/m³ "
                 f"(target was {target_biomass_cod_kg_m3:.1f} kg/m³)")
 
     return inoculum_state
@@ -18,11 +18,11 @@ def calculate_vfa_alkalinity(stream_data, pH):
     # Components are nested in 'components' dict
     components = stream_data.get('components', {})
     vfa_mg_l = (
-        components.get('S_ac', 0) * 1000 +  # Convert kg/m3 to mg/L
-        components.get('S_pro', 0) * 1000 +
-        components.get('S_bu', 0) * 1000 +
-        components.get('S_va', 0) * 1000
-    )
+        components.get('S_ac', 0) +
+        components.get('S_pro', 0) +
+        components.get('S_bu', 0) +
+        components.get('S_va', 0)
+    ) * 1000  # Convert kg/m3 to mg/L once for the summed VFA
 
     # Extract alkalinity (already in meq/L from stream data)
     alkalinity_meq_l = stream_data.get('alkalinity', 0)
@@ -22,10 +22,22 @@ import io
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
+# Column layout shared by every "Metric | Value | Units" row
+_ROW_FMT = "{:<50} {:<20} {:<20}".format
+
+
+def _row(label, value, units='', spec=''):
+    """Format one table row, applying ``spec`` (e.g. '.2f') to the value."""
+    return _ROW_FMT(label, format(value, spec), units)
+
+
 def parse_and_display_results(perf_file='simulation_performance.json',
                               inhib_file='simulation_inhibition.json',
                               precip_file='simulation_precipitation.json'):
     """Parse and display simulation results in three tables."""
+    # Collect the report and write it once instead of one print per row
+    lines = []
+    out = lines.append
 
     # Read the three summary files
     with open(perf_file) as f:
@@ -36,44 +48,44 @@ def parse_and_display_results(perf_file='simulation_performance.json',
         precip = json.load(f)
 
     # Performance Metrics Table
-    print("=" * 90)
-    print("TABLE 1: PERFORMANCE METRICS")
-    print("=" * 90)
-    print(f"{'Metric':<50} {'Value':<20} {'Units':<20}")
-    print("-" * 90)
+    out("=" * 90)
+    out("TABLE 1: PERFORMANCE METRICS")
+    out("=" * 90)
+    out(_row('Metric', 'Value', 'Units'))
+    out("-" * 90)
 
     # Influent characteristics
-    print("\n--- Influent Characteristics ---")
+    out("\n--- Influent Characteristics ---")
     inf = perf['streams']['influent']
-    print(f"{'Flow Rate':<50} {inf['flow_m3_d']:<20.2f} {'m³/d':<20}")
-    print(f"{'COD':<50} {inf['COD_mg_L']:<20.1f} {'mg/L':<20}")
-    print(f"{'VSS':<50} {inf['VSS_mg_L']:<20.1f} {'mg/L':<20}")
-    print(f"{'pH':<50} {inf['pH']:<20.2f} {'':<20}")
-    print(f"{'Alkalinity':<50} {inf['alkalinity_meq_L']:<20.1f} {'meq/L':<20}")
+    out(_row('Flow Rate', inf['flow_m3_d'], 'm³/d', '.2f'))
+    out(_row('COD', inf['COD_mg_L'], 'mg/L', '.1f'))
+    out(_row('VSS', inf['VSS_mg_L'], 'mg/L', '.1f'))
+    out(_row('pH', inf['pH'], '', '.2f'))
+    out(_row('Alkalinity', inf['alkalinity_meq_L'], 'meq/L', '.1f'))
 
     # Effluent characteristics
-    print("\n--- Effluent Characteristics ---")
+    out("\n--- Effluent Characteristics ---")
     eff = perf['streams']['effluent']
-    print(f"{'pH':<50} {eff['pH']:<20.2f} {'':<20}")
-    print(f"{'COD':<50} {eff['COD_mg_L']:<20.1f} {'mg/L':<20}")
-    print(f"{'VSS':<50} {eff['VSS_mg_L']:<20.1f} {'mg/L':<20}")
-    print(f"{'Total VFA':<50} {eff['total_VFA_mg_L']:<20.1f} {'mg/L':<20}")
-    print(f"{'Alkalinity':<50} {eff['alkalinity_meq_L']:<20.1f} {'meq/L':<20}")
+    out(_row('pH', eff['pH'], '', '.2f'))
+    out(_row('COD', eff['COD_mg_L'], 'mg/L', '.1f'))
+    out(_row('VSS', eff['VSS_mg_L'], 'mg/L', '.1f'))
+    out(_row('Total VFA', eff['total_VFA_mg_L'], 'mg/L', '.1f'))
+    out(_row('Alkalinity', eff['alkalinity_meq_L'], 'meq/L', '.1f'))
 
     # Biogas production
-    print("\n--- Biogas Production ---")
+    out("\n--- Biogas Production ---")
     bg = perf['streams']['biogas']
-    print(f"{'Total Biogas Production':<50} {bg['flow_total_m3_d']:<20.2f} {'m³/d':<20}")
-    print(f"{'Methane Production':<50} {bg['methane_flow_m3_d']:<20.2f} {'m³/d':<20}")
-    print(f"{'Methane Content':<50} {bg['methane_percent']:<20.2f} {'%':<20}")
-    print(f"{'CO₂ Content':<50} {bg['co2_percent']:<20.2f} {'%':<20}")
-    print(f"{'H₂ Content':<50} {bg['h2_percent']:<20.2f} {'%':<20}")
-    print(f"{'H₂S Content':<50} {bg['h2s_ppm']:<20.1f} {'ppmv':<20}")
+    out(_row('Total Biogas Production', bg['flow_total_m3_d'], 'm³/d', '.2f'))
+    out(_row('Methane Production', bg['methane_flow_m3_d'], 'm³/d', '.2f'))
+    out(_row('Methane Content', bg['methane_percent'], '%', '.2f'))
+    out(_row('CO₂ Content', bg['co2_percent'], '%', '.2f'))
+    out(_row('H₂ Content', bg['h2_percent'], '%', '.2f'))
+    out(_row('H₂S Content', bg['h2s_ppm'], 'ppmv', '.1f'))
 
     # Yields
-    print("\n--- Process Yields (KEY METRICS) ---")
+    out("\n--- Process Yields (KEY METRICS) ---")
     yld = perf['yields']
-    print(f"{'COD Removal Efficiency':<50} {yld['COD_removal_efficiency_percent']:<20.2f} {'%':<20}")
+    out(_row('COD Removal Efficiency', yld['COD_removal_efficiency_percent'], '%', '.2f'))
 
     # Methane yields
     my = yld['methane_yields']
@@ -86,74 +98,75 @@ def parse_and_display_results(perf_file='simulation_performance.json',
         else:
             spec_yield = 0
 
-    print(f"{'★ SPECIFIC METHANE YIELD':<50} {spec_yield:<20.3f} {'m³/kg COD removed':<20}")
-    print(f"{'★ SPECIFIC METHANE YIELD':<50} {spec_yield*1000:<20.1f} {'L/kg COD removed':<20}")
-    print(f"{'Theoretical Methane Yield':<50} {my['theoretical_methane_yield_m3_kg_COD']:<20.3f} {'m³/kg COD':<20}")
+    out(_row('★ SPECIFIC METHANE YIELD', spec_yield, 'm³/kg COD removed', '.3f'))
+    out(_row('★ SPECIFIC METHANE YIELD', spec_yield*1000, 'L/kg COD removed', '.1f'))
+    out(_row('Theoretical Methane Yield', my['theoretical_methane_yield_m3_kg_COD'], 'm³/kg COD', '.3f'))
 
     # Biomass yields
     by = yld['biomass_yields']
-    print(f"{'★ NET VSS YIELD':<50} {by['net_VSS_yield_kg_kg_COD_removed']:<20.3f} {'kg VSS/kg COD removed':<20}")
-    print(f"{'★ NET TSS YIELD':<50} {by['net_TSS_yield_kg_kg_COD_removed']:<20.3f} {'kg TSS/kg COD removed':<20}")
+    out(_row('★ NET VSS YIELD', by['net_VSS_yield_kg_kg_COD_removed'], 'kg VSS/kg COD removed', '.3f'))
+    out(_row('★ NET TSS YIELD', by['net_TSS_yield_kg_kg_COD_removed'], 'kg TSS/kg COD removed', '.3f'))
 
-    print("=" * 90)
-    print()
+    out("=" * 90)
+    out("")
 
     # Inhibition Metrics Table
-    print("=" * 90)
-    print("TABLE 2: INHIBITION METRICS")
-    print("=" * 90)
-    print(f"{'Metric':<50} {'Value':<20} {'Units':<20}")
-    print("-" * 90)
+    out("=" * 90)
+    out("TABLE 2: INHIBITION METRICS")
+    out("=" * 90)
+    out(_row('Metric', 'Value', 'Units'))
+    out("-" * 90)
 
     # Overall health
-    print("\n--- Overall Methanogen Health ---")
+    out("\n--- Overall Methanogen Health ---")
     summ = inhib['summary']
-    print(f"{'Acetoclastic Methanogen Health':<50} {summ['acetoclastic_methanogen_health_percent']:<20.1f} {'%':<20}")
-    print(f"{'Hydrogenotrophic Methanogen Health':<50} {summ['hydrogenotrophic_methanogen_health_percent']:<20.1f} {'%':<20}")
-    print(f"{'Overall Methanogen Health':<50} {summ['overall_methanogen_health_percent']:<20.1f} {'%':<20}")
-    print(f"{'Primary Limiting Factor':<50} {summ['primary_limiting_factor']:<20} {'':<20}")
-    print(f"{'Secondary Limiting Factor':<50} {summ.get('secondary_limiting_factor', 'None'):<20} {'':<20}")
+    out(_row('Acetoclastic Methanogen Health', summ['acetoclastic_methanogen_health_percent'], '%', '.1f'))
+    out(_row('Hydrogenotrophic Methanogen Health', summ['hydrogenotrophic_methanogen_health_percent'], '%', '.1f'))
+    out(_row('Overall Methanogen Health', summ['overall_methanogen_health_percent'], '%', '.1f'))
+    out(_row('Primary Limiting Factor', summ['primary_limiting_factor']))
+    out(_row('Secondary Limiting Factor', summ.get('secondary_limiting_factor', 'None')))
 
     # pH inhibition
-    print("\n--- pH Inhibition ---")
+    out("\n--- pH Inhibition ---")
     ph_ac = inhib['pH_inhibition']['acetoclastic_methanogens']
     ph_h2 = inhib['pH_inhibition']['hydrogenotrophic_methanogens']
-    print(f"{'Actual pH':<50} {ph_ac['actual_pH']:<20.2f} {'':<20}")
-    print(f"{'Acetoclastic Methanogens Inhibition':<50} {ph_ac['inhibition_percent']:<20.1f} {'%':<20}")
-    print(f"{'Hydrogenotrophic Methanogens Inhibition':<50} {ph_h2['inhibition_percent']:<20.1f} {'%':<20}")
-    print(f"{'Optimal pH Range (Acetogens)':<50} {f"{ph_ac['pH_lower_limit']}-{ph_ac['pH_upper_limit']}":<20} {'':<20}")
+    ph_range = f"{ph_ac['pH_lower_limit']}-{ph_ac['pH_upper_limit']}"
+    out(_row('Actual pH', ph_ac['actual_pH'], '', '.2f'))
+    out(_row('Acetoclastic Methanogens Inhibition', ph_ac['inhibition_percent'], '%', '.1f'))
+    out(_row('Hydrogenotrophic Methanogens Inhibition', ph_h2['inhibition_percent'], '%', '.1f'))
+    out(_row('Optimal pH Range (Acetogens)', ph_range))
 
     # Ammonia inhibition
-    print("\n--- Ammonia Inhibition ---")
+    out("\n--- Ammonia Inhibition ---")
     nh3 = inhib['ammonia_inhibition']['free_ammonia_inhibition']
-    print(f"{'Free Ammonia Inhibition':<50} {nh3['inhibition_percent']:<20.2f} {'%':<20}")
+    out(_row('Free Ammonia Inhibition', nh3['inhibition_percent'], '%', '.2f'))
 
     # H2 inhibition
-    print("\n--- Hydrogen Inhibition ---")
+    out("\n--- Hydrogen Inhibition ---")
     h2_prop = inhib['h2_inhibition']['propionate']
     h2_lcfa = inhib['h2_inhibition']['LCFA_uptake']
-    print(f"{'Propionate Degradation Inhibition':<50} {h2_prop['inhibition_percent']:<20.1f} {'%':<20}")
-    print(f"{'LCFA Uptake Inhibition':<50} {h2_lcfa['inhibition_percent']:<20.1f} {'%':<20}")
+    out(_row('Propionate Degradation Inhibition', h2_prop['inhibition_percent'], '%', '.1f'))
+    out(_row('LCFA Uptake Inhibition', h2_lcfa['inhibition_percent'], '%', '.1f'))
 
-    print("=" * 90)
-    print()
+    out("=" * 90)
+    out("")
 
     # Precipitation Metrics Table
-    print("=" * 90)
-    print("TABLE 3: PRECIPITATION METRICS")
-    print("=" * 90)
-    print(f"{'Metric':<50} {'Value':<20} {'Units':<20}")
-    print("-" * 90)
+    out("=" * 90)
+    out("TABLE 3: PRECIPITATION METRICS")
+    out("=" * 90)
+    out(_row('Metric', 'Value', 'Units'))
+    out("-" * 90)
 
     # Summary
-    print("\n--- Precipitation Summary ---")
+    out("\n--- Precipitation Summary ---")
     p_summ = precip['summary']
-    print(f"{'Total Precipitation Rate':<50} {p_summ['total_precipitation_kg_d']:<20.3f} {'kg/d':<20}")
-    print(f"{'Phosphorus Precipitated':<50} {p_summ['total_phosphorus_precipitated_kg_P_d']:<20.3f} {'kg-P/d':<20}")
-    print(f"{'Sulfur Precipitated':<50} {p_summ['total_sulfur_precipitated_kg_S_d']:<20.3f} {'kg-S/d':<20}")
+    out(_row('Total Precipitation Rate', p_summ['total_precipitation_kg_d'], 'kg/d', '.3f'))
+    out(_row('Phosphorus Precipitated', p_summ['total_phosphorus_precipitated_kg_P_d'], 'kg-P/d', '.3f'))
+    out(_row('Sulfur Precipitated', p_summ['total_sulfur_precipitated_kg_S_d'], 'kg-S/d', '.3f'))
 
     # Major minerals
-    print("\n--- Major Mineral Species ---")
+    out("\n--- Major Mineral Species ---")
     mins = precip['minerals']
     mineral_list = [
         ('Struvite (MgNH₄PO₄)', 'struvite_MgNH4PO4'),
@@ -169,16 +182,16 @@ def parse_and_display_results(perf_file='simulation_performance.json',
             rate = mins[key].get('rate_kg_d', 0)
             conc = mins[key].get('concentration_mg_L', 0)
             if abs(rate) > 0.001 or abs(conc) > 0.001:
-                print(f"{label + ' Rate':<50} {rate:<20.4f} {'kg/d':<20}")
-                print(f"{label + ' Concentration':<50} {conc:<20.2f} {'mg/L':<20}")
+                out(_row(label + ' Rate', rate, 'kg/d', '.4f'))
+                out(_row(label + ' Concentration', conc, 'mg/L', '.2f'))
 
-    print("=" * 90)
-    print()
+    out("=" * 90)
+    out("")
 
     # Overall Assessment
-    print("=" * 90)
-    print("OVERALL ASSESSMENT")
-    print("=" * 90)
+    out("=" * 90)
+    out("OVERALL ASSESSMENT")
+    out("=" * 90)
 
     # Check for critical issues
     issues = []
@@ -205,26 +218,28 @@ def parse_and_display_results(perf_file='simulation_performance.json',
         issues.append(f"CRITICAL: Methanogen health = {summ['overall_methanogen_health_percent']:.1f}% (target: >70%)")
 
     if issues:
-        print("\n❌ CRITICAL ISSUES:")
+        out("\n❌ CRITICAL ISSUES:")
         for issue in issues:
-            print(f"  • {issue}")
+            out(f"  • {issue}")
 
     if warnings:
-        print("\n⚠️  WARNINGS:")
+        out("\n⚠️  WARNINGS:")
         for warn in warnings:
-            print(f"  • {warn}")
+            out(f"  • {warn}")
 
     if not issues and not warnings:
-        print("\n✅ System operating within normal parameters")
+        out("\n✅ System operating within normal parameters")
 
-    print("\n" + "=" * 90)
+    out("\n" + "=" * 90)
 
     # Summary note
-    print("\nKEY FINDINGS:")
-    print(f"  • Specific Methane Yield: {spec_yield:.3f} m³/kg COD = {spec_yield*1000:.1f} L/kg COD")
-    print(f"  • Net Biomass Yield: {by['net_VSS_yield_kg_kg_COD_removed']:.3f} kg VSS/kg COD")
-    print(f"  • Digester Status: {'FAILED - pH Collapse' if eff['pH'] < 6.0 else 'OPERATIONAL'}")
-    print("=" * 90)
+    out("\nKEY FINDINGS:")
+    out(f"  • Specific Methane Yield: {spec_yield:.3f} m³/kg COD = {spec_yield*1000:.1f} L/kg COD")
+    out(f"  • Net Biomass Yield: {by['net_VSS_yield_kg_kg_COD_removed']:.3f} kg VSS/kg COD")
+    out(f"  • Digester Status: {'FAILED - pH Collapse' if eff['pH'] < 6.0 else 'OPERATIONAL'}")
+    out("=" * 90)
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
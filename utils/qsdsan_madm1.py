@@ -23,12 +23,12 @@ from qsdsan.processes._adm1 import (
     mass2mol_conversion,
     T_correction_factor,
     substr_inhibit,
-    non_compet_inhibit,
-    Hill_inhibit
+    non_compet_inhibit
     )
 # Import thermodynamic functions for mineral precipitation
 from .thermodynamics import calc_saturation_indices
-# from scipy.optimize import brenth
+# QSDsan production pH solver (per Codex recommendation)
+from scipy.optimize import brenth
 # from warnings import warn
 
 
@@ -303,6 +303,21 @@ def create_madm1_cmps(set_thermo=True, ASF_L=0.31, ASF_H=1.2):
 #     }
 # =============================================================================
 
+_unit_conversion_cache = {}
+
+def _mass2mol(cmps):
+    """
+    Cached ``mass2mol_conversion(cmps)`` (kg/m³ → mol/L factors).
+
+    The factors depend only on the compiled component set, but they are needed
+    by ``rhos_madm1``, ``pcm`` and ``calc_biogas`` on every rate evaluation.
+    The returned array is shared and must not be modified in place.
+    """
+    cached = _unit_conversion_cache.get(id(cmps))
+    if cached is None or cached[0] is not cmps:
+        cached = _unit_conversion_cache[id(cmps)] = (cmps, mass2mol_conversion(cmps))
+    return cached[1]
+
 def calc_pH():
     pass
 
@@ -349,7 +364,7 @@ def calc_biogas(state_arr, params, pH):
     # CRITICAL: Must match unit_conversion at line 819 in rhos_madm1
     # The inconsistent i_mass/chem_MW was causing H2S to be on wrong scale
     # FIX: Remove extra 1e3 factor - mass2mol_conversion already converts kg/m³ to mol/L
-    unit_conversion = mass2mol_conversion(cmps)  # kg/m³ → mol/L (NOT kmol/m³!)
+    unit_conversion = _mass2mol(cmps)  # kg/m³ → mol/L (NOT kmol/m³!)
     S_IS_M = S_IS_kg * unit_conversion[is_idx]
 
     # Codex fix #7: Get temperature-corrected Ka_h2s from params
@@ -366,6 +381,33 @@ def calc_biogas(state_arr, params, pH):
 
     return h2s
 
+# Lumped charge-balance ion groups: (Na⁺), (Mg²⁺, Ca²⁺, Fe²⁺), (Fe³⁺, Al³⁺), (Cl⁻)
+_LUMPED_ION_GROUPS = (
+    ('S_Na',),
+    ('S_Mg', 'S_Ca', 'S_Fe2'),
+    ('S_Fe3', 'S_Al'),
+    ('S_Cl',),
+)
+_lumped_ion_index_cache = {}
+
+def _lumped_ion_indices(cmps):
+    """
+    Resolve ``_LUMPED_ION_GROUPS`` to integer index arrays for ``cmps``.
+
+    Cached by component IDs so the ``cmps.index``/``cmps.IDs`` lookups are
+    not repeated on every rate evaluation.
+    """
+    key = cmps.IDs
+    indices = _lumped_ion_index_cache.get(key)
+    if indices is None:
+        present = set(key)
+        indices = tuple(
+            np.array([cmps.index(ID) for ID in group if ID in present], dtype=int)
+            for group in _LUMPED_ION_GROUPS
+        )
+        _lumped_ion_index_cache[key] = indices
+    return indices
+
 def _compute_lumped_ions(state_liquid, cmps, unit_conversion):
     """
     Compute lumped S_cat/S_an from measured ion concentrations in mADM1 state.
@@ -394,43 +436,100 @@ def _compute_lumped_ions(state_liquid, cmps, unit_conversion):
         where S_cat = Na⁺, S_divalent = Mg²⁺ + Ca²⁺ + Fe²⁺,
         S_trivalent = Fe³⁺ + Al³⁺, S_an = Cl⁻
     """
-    # Extract measured monovalent ions from state (Codex fix #3)
-    S_Na = state_liquid[cmps.index('S_Na')] if 'S_Na' in cmps.IDs else 0.0
-    S_Cl = state_liquid[cmps.index('S_Cl')] if 'S_Cl' in cmps.IDs else 0.0
-
-    # Extract divalent cations (Codex fix #4)
-    S_Mg = state_liquid[cmps.index('S_Mg')] if 'S_Mg' in cmps.IDs else 0.0
-    S_Ca = state_liquid[cmps.index('S_Ca')] if 'S_Ca' in cmps.IDs else 0.0
-    S_Fe2 = state_liquid[cmps.index('S_Fe2')] if 'S_Fe2' in cmps.IDs else 0.0
-
-    # Extract trivalent cations (Codex fix #6: for iron/alum dosing)
-    S_Fe3 = state_liquid[cmps.index('S_Fe3')] if 'S_Fe3' in cmps.IDs else 0.0
-    S_Al = state_liquid[cmps.index('S_Al')] if 'S_Al' in cmps.IDs else 0.0
+    # Index arrays are resolved once per component set (this runs on every
+    # rate evaluation); ions absent from the set simply contribute nothing.
+    # Codex fix #3: measured Na⁺/Cl⁻; #4: Mg²⁺ + Ca²⁺ + Fe²⁺; #6: Fe³⁺ + Al³⁺
+    idx_cat, idx_div, idx_tri, idx_an = _lumped_ion_indices(cmps)
 
     # Convert to molar concentrations
-    S_cat_M = S_Na * unit_conversion[cmps.index('S_Na')] if 'S_Na' in cmps.IDs else 0.0
-    S_an_M = S_Cl * unit_conversion[cmps.index('S_Cl')] if 'S_Cl' in cmps.IDs else 0.0
+    S_cat_M = float(np.dot(state_liquid[idx_cat], unit_conversion[idx_cat]))
+    S_an_M = float(np.dot(state_liquid[idx_an], unit_conversion[idx_an]))
 
     # Aggregate divalents: Mg²⁺ + Ca²⁺ + Fe²⁺ (all contribute 2× charge)
-    S_divalent_M = 0.0
-    if 'S_Mg' in cmps.IDs:
-        S_divalent_M += S_Mg * unit_conversion[cmps.index('S_Mg')]
-    if 'S_Ca' in cmps.IDs:
-        S_divalent_M += S_Ca * unit_conversion[cmps.index('S_Ca')]
-    if 'S_Fe2' in cmps.IDs:
-        S_divalent_M += S_Fe2 * unit_conversion[cmps.index('S_Fe2')]
+    S_divalent_M = float(np.dot(state_liquid[idx_div], unit_conversion[idx_div]))
 
     # Aggregate trivalents: Fe³⁺ + Al³⁺ (all contribute 3× charge)
     # Codex fix #6: Prevents pH bias during iron/alum dosing campaigns
-    S_trivalent_M = 0.0
-    if 'S_Fe3' in cmps.IDs:
-        S_trivalent_M += S_Fe3 * unit_conversion[cmps.index('S_Fe3')]
-    if 'S_Al' in cmps.IDs:
-        S_trivalent_M += S_Al * unit_conversion[cmps.index('S_Al')]
+    S_trivalent_M = float(np.dot(state_liquid[idx_tri], unit_conversion[idx_tri]))
 
     return S_cat_M, S_divalent_M, S_trivalent_M, S_an_M
 
 
+# QSDsan ADM1/mADM1 acid-base reaction (charge balance), defined once at module
+# level rather than re-created inside pcm() on every rate evaluation
+def _acid_base_rxn(h_ion, weak_acids_tot, Kas, Ka_h2s_param):
+    """
+    Charge balance equation - adapted for mADM1's 7-element Ka array + sulfur + trivalents.
+
+    mADM1 Ka structure: [Kw, Ka_nh, Ka_co2, Ka_ac, Ka_pr, Ka_bu, Ka_va]
+    (No Ka_h2po4 - phosphate not in standard mADM1 Ka array)
+
+    Codex fix #5: Includes sulfur species (SO₄²⁻, HS⁻) to prevent pH bias
+    in sulfur-rich scenarios.
+
+    Codex fix #6: Includes trivalent cations (Fe³⁺, Al³⁺) to prevent pH bias
+    during iron/alum dosing campaigns.
+
+    Codex fix #7: Uses temperature-corrected Ka_h2s for H2S/HS⁻ equilibrium
+    to ensure thermodynamic consistency with calc_biogas.
+    """
+    S_cat, S_K, S_Mg, S_trivalent, S_an, S_IN, S_IP = weak_acids_tot[:7]
+    Kw = Kas[0]
+    oh_ion = Kw / h_ion
+
+    # Henderson-Hasselbalch for weak acids (without phosphate)
+    # weak_acids_tot[7:12] = [S_IC, S_ac, S_pro, S_bu, S_va] (5 VFAs + IC)
+    # weak_acids_tot[12:14] = [S_SO4, S_IS] (sulfur species, Codex fix #5)
+    S_IC, S_ac_tot, S_pro_tot, S_bu_tot, S_va_tot, S_SO4, S_IS = weak_acids_tot[7:]
+
+    # Calculate deprotonated forms (Ka * total / (Ka + H⁺))
+    nh3 = Kas[1] * S_IN / (Kas[1] + h_ion)
+    # No phosphate speciation - assume S_IP is minimal in mADM1
+    hpo4 = S_IP  # Approximate as fully deprotonated (HPO₄²⁻)
+    hco3 = Kas[2] * S_IC / (Kas[2] + h_ion)
+    ac = Kas[3] * S_ac_tot / (Kas[3] + h_ion)
+    pro = Kas[4] * S_pro_tot / (Kas[4] + h_ion)
+    bu = Kas[5] * S_bu_tot / (Kas[5] + h_ion)
+    va = Kas[6] * S_va_tot / (Kas[6] + h_ion)
+
+    # Codex fix #5/#7: Calculate HS⁻ speciation using temperature-corrected Ka_h2s
+    # H2S <-> HS⁻ + H⁺, pKa ~ 7.0 at 25°C
+    # Now using Ka_h2s from params (matches calc_biogas)
+    hs = Ka_h2s_param * S_IS / (Ka_h2s_param + h_ion)  # HS⁻ concentration
+
+    # Charge balance: cations - anions = 0
+    # Codex fix #5: Add sulfur terms: -2*SO₄²⁻ - HS⁻
+    # Codex fix #6: Add trivalent term: +3*S_trivalent (Fe³⁺ + Al³⁺)
+    return (S_cat + S_K + 2*S_Mg + 3*S_trivalent + h_ion + (S_IN - nh3)
+            - S_an - oh_ion - hco3 - ac - pro - bu - va
+            - 2*hpo4 - (S_IP - hpo4)
+            - 2*S_SO4 - hs)
+
+
+# Explicit weak-acid species read by pcm(), in weak_acids order; the optional
+# ones contribute 0 when missing from the component set
+_PCM_SPECIES = ('S_K', 'S_IN', 'S_IP', 'S_IC', 'S_ac', 'S_pro', 'S_bu', 'S_va', 'S_SO4', 'S_IS')
+_PCM_OPTIONAL_SPECIES = frozenset(('S_IP', 'S_SO4', 'S_IS'))
+_pcm_species_index_cache = {}
+
+def _pcm_species_indices(cmps):
+    """
+    Resolve ``_PCM_SPECIES`` to ``(indices, present)`` arrays for ``cmps``.
+
+    Absent optional species get index 0 with ``present=False``; absent required
+    species raise ``ValueError`` from ``cmps.index`` as before.
+    """
+    key = cmps.IDs
+    cached = _pcm_species_index_cache.get(key)
+    if cached is None:
+        ids = set(key)
+        missing = [ID in _PCM_OPTIONAL_SPECIES and ID not in ids for ID in _PCM_SPECIES]
+        indices = np.array([0 if miss else cmps.index(ID)
+                            for ID, miss in zip(_PCM_SPECIES, missing)], dtype=int)
+        cached = _pcm_species_index_cache[key] = (indices, ~np.array(missing))
+    return cached
+
+
 def pcm(state_arr, params):
     """
     Production-grade pH/Carbonate/amMonia (PCM) equilibrium model for mADM1.
@@ -469,9 +568,6 @@ def pcm(state_arr, params):
     - Add Davies/Pitzer activity models for ionic strength correction
     - Explicitly track Ca²⁺, Fe²⁺ in S_Mg aggregation
     """
-    # Import QSDsan production solver (per Codex recommendation)
-    from scipy.optimize import brenth
-
     # Extract parameters
     Ka_base = np.array(params['Ka_base'])
     Ka_dH = np.array(params['Ka_dH'])
@@ -499,8 +595,7 @@ def pcm(state_arr, params):
     # Unit conversion from kg/m³ to M (mol/L)
     # FIX: Use mass2mol_conversion which includes the ×1000 factor for m³→L
     # The previous calculation was missing this factor, inflating ionic strengths by 1000×
-    from qsdsan.processes import mass2mol_conversion
-    unit_conversion = mass2mol_conversion(cmps)
+    unit_conversion = _mass2mol(cmps)
 
     # Slice to liquid components (first len(cmps) entries)
     n_cmps = len(cmps)
@@ -514,92 +609,35 @@ def pcm(state_arr, params):
     # Codex fix #6: Include trivalents (Fe3+, Al3+) for iron/alum dosing scenarios
     S_cat_M, S_divalent_M, S_trivalent_M, S_an_M = _compute_lumped_ions(state_liquid, cmps, unit_conversion)
 
-    # Get explicit components (in kg/m³)
-    S_K = state_liquid[cmps.index('S_K')] if 'S_K' in cmps.IDs else 0.0
-    S_IN = state_liquid[cmps.index('S_IN')]
-    S_IP = state_liquid[cmps.index('S_IP')] if 'S_IP' in cmps.IDs else 0.0
-    S_IC = state_liquid[cmps.index('S_IC')]
-    S_ac = state_liquid[cmps.index('S_ac')]
-    S_pro = state_liquid[cmps.index('S_pro')]
-    S_bu = state_liquid[cmps.index('S_bu')]
-    S_va = state_liquid[cmps.index('S_va')]
-
-    # Codex fix #5: Add sulfur species for complete charge balance
-    S_SO4 = state_liquid[cmps.index('S_SO4')] if 'S_SO4' in cmps.IDs else 0.0
-    S_IS = state_liquid[cmps.index('S_IS')] if 'S_IS' in cmps.IDs else 0.0
+    # Gather the explicit weak-acid species from the molar state in one pass
+    # (index arrays cached per component set; S_IP/S_SO4/S_IS are 0 when absent)
+    # Codex fix #5: S_SO4 and S_IS included for complete charge balance
+    idx, present = _pcm_species_indices(cmps)
+    (S_K_M, S_IN_M, S_IP_M, S_IC_M, S_ac_M, S_pro_M, S_bu_M, S_va_M,
+     S_SO4_M, S_IS_M) = np.where(present, cmps_in_M[idx], 0.0)
 
     # Build 14-element weak-acid vector (molar concentrations)
     # S_cat, S_divalent, S_trivalent, S_an already in M from _compute_lumped_ions
-    # Others need conversion from kg/m³ to M
     weak_acids = np.array([
         S_cat_M,       # Na+ (molar)
-        S_K * unit_conversion[cmps.index('S_K')],
+        S_K_M,
         S_divalent_M,  # Mg2+ + Ca2+ + Fe2+ (molar, Codex fix #4)
         S_trivalent_M, # Fe3+ + Al3+ (molar, Codex fix #6)
         S_an_M,        # Cl- (molar, Codex fix #3)
-        S_IN * unit_conversion[cmps.index('S_IN')],
-        S_IP * unit_conversion[cmps.index('S_IP')] if 'S_IP' in cmps.IDs else 0.0,
-        S_IC * unit_conversion[cmps.index('S_IC')],
-        S_ac * unit_conversion[cmps.index('S_ac')],
-        S_pro * unit_conversion[cmps.index('S_pro')],
-        S_bu * unit_conversion[cmps.index('S_bu')],
-        S_va * unit_conversion[cmps.index('S_va')],
-        S_SO4 * unit_conversion[cmps.index('S_SO4')] if 'S_SO4' in cmps.IDs else 0.0,  # Codex fix #5
-        S_IS * unit_conversion[cmps.index('S_IS')] if 'S_IS' in cmps.IDs else 0.0      # Codex fix #5
+        S_IN_M,
+        S_IP_M,
+        S_IC_M,
+        S_ac_M,
+        S_pro_M,
+        S_bu_M,
+        S_va_M,
+        S_SO4_M,       # Codex fix #5
+        S_IS_M         # Codex fix #5
     ])
 
-    # QSDsan ADM1/mADM1 acid-base reaction (charge balance)
-    def acid_base_rxn(h_ion, weak_acids_tot, Kas, Ka_h2s_param):
-        """
-        Charge balance equation - adapted for mADM1's 7-element Ka array + sulfur + trivalents.
-
-        mADM1 Ka structure: [Kw, Ka_nh, Ka_co2, Ka_ac, Ka_pr, Ka_bu, Ka_va]
-        (No Ka_h2po4 - phosphate not in standard mADM1 Ka array)
-
-        Codex fix #5: Includes sulfur species (SO₄²⁻, HS⁻) to prevent pH bias
-        in sulfur-rich scenarios.
-
-        Codex fix #6: Includes trivalent cations (Fe³⁺, Al³⁺) to prevent pH bias
-        during iron/alum dosing campaigns.
-
-        Codex fix #7: Uses temperature-corrected Ka_h2s for H2S/HS⁻ equilibrium
-        to ensure thermodynamic consistency with calc_biogas.
-        """
-        S_cat, S_K, S_Mg, S_trivalent, S_an, S_IN, S_IP = weak_acids_tot[:7]
-        Kw = Kas[0]
-        oh_ion = Kw / h_ion
-
-        # Henderson-Hasselbalch for weak acids (without phosphate)
-        # weak_acids_tot[7:12] = [S_IC, S_ac, S_pro, S_bu, S_va] (5 VFAs + IC)
-        # weak_acids_tot[12:14] = [S_SO4, S_IS] (sulfur species, Codex fix #5)
-        S_IC, S_ac_tot, S_pro_tot, S_bu_tot, S_va_tot, S_SO4, S_IS = weak_acids_tot[7:]
-
-        # Calculate deprotonated forms (Ka * total / (Ka + H⁺))
-        nh3 = Kas[1] * S_IN / (Kas[1] + h_ion)
-        # No phosphate speciation - assume S_IP is minimal in mADM1
-        hpo4 = S_IP  # Approximate as fully deprotonated (HPO₄²⁻)
-        hco3 = Kas[2] * S_IC / (Kas[2] + h_ion)
-        ac = Kas[3] * S_ac_tot / (Kas[3] + h_ion)
-        pro = Kas[4] * S_pro_tot / (Kas[4] + h_ion)
-        bu = Kas[5] * S_bu_tot / (Kas[5] + h_ion)
-        va = Kas[6] * S_va_tot / (Kas[6] + h_ion)
-
-        # Codex fix #5/#7: Calculate HS⁻ speciation using temperature-corrected Ka_h2s
-        # H2S <-> HS⁻ + H⁺, pKa ~ 7.0 at 25°C
-        # Now using Ka_h2s from params (matches calc_biogas)
-        hs = Ka_h2s_param * S_IS / (Ka_h2s_param + h_ion)  # HS⁻ concentration
-
-        # Charge balance: cations - anions = 0
-        # Codex fix #5: Add sulfur terms: -2*SO₄²⁻ - HS⁻
-        # Codex fix #6: Add trivalent term: +3*S_trivalent (Fe³⁺ + Al³⁺)
-        return (S_cat + S_K + 2*S_Mg + 3*S_trivalent + h_ion + (S_IN - nh3)
-                - S_an - oh_ion - hco3 - ac - pro - bu - va
-                - 2*hpo4 - (S_IP - hpo4)
-                - 2*S_SO4 - hs)
-
     # Solve for H⁺ using Brent's method (production QSDsan approach)
     # Codex fix #7: Pass Ka_h2s to ensure consistency with calc_biogas
-    h = brenth(acid_base_rxn, 1e-14, 1.0,
+    h = brenth(_acid_base_rxn, 1e-14, 1.0,
                args=(weak_acids, Ka, Ka_h2s),
                xtol=1e-12, maxiter=100)
     pH = -np.log10(h)
@@ -607,16 +645,13 @@ def pcm(state_arr, params):
     # Calculate NH₃ and CO₂ using same Ka (thermodynamically consistent)
     # Codex fix #1/#2: Use ADM1 forms with correct unit handling
     # mADM1 indexing: Ka[1]=Ka_nh, Ka[2]=Ka_co2
-    unit_conv_IN = unit_conversion[cmps.index('S_IN')]
-    unit_conv_IC = unit_conversion[cmps.index('S_IC')]
-
     # Codex fix #1: NH3 = S_IN * unit_conv * Ka / (Ka + h)
     # Matches QSDsan ADM1 production form (no unit mixing in denominator)
-    nh3 = S_IN * unit_conv_IN * Ka[1] / (Ka[1] + h)
+    nh3 = S_IN_M * Ka[1] / (Ka[1] + h)
 
     # Codex fix #2: CO2 = S_IC * unit_conv * h / (Ka + h)
     # Includes (Ka + h) denominator for correct equilibrium (was missing)
-    co2 = S_IC * unit_conv_IC * h / (Ka[2] + h)
+    co2 = S_IC_M * h / (Ka[2] + h)
 
     # Placeholder activities (unity for now)
     # Future: compute ionic strength and apply Davies/Debye-Hückel
@@ -786,6 +821,10 @@ def grad_dydt_Sh2_AD(S_h2, state_arr, h, params, f_stoichio, V_liq, S_h2_in, eps
 rhos = np.zeros(38+8+13+4) # 38 biological + 8 chemical P removal by HFO + 13 MMP + 4 gas transfer
 Cs = np.empty(38+8)
 sum_stoichios = np.array([2, 2, 5, 9, 3, 8, 3, 3, 2, 3, 2, 2, 2])  # 13 minerals stoichiometry
+_inv_sum_stoichios = 1 / sum_stoichios  # constant exponent of the SI driving force
+# Mineral order of state_arr[47:60]:
+# X_CCM, X_ACC, X_ACP, X_HAP, X_DCPD, X_OCP, X_struv, X_newb, X_magn, X_kstruv, X_FeS, X_Fe3PO42, X_AlPO4
+_MINERAL_NAMES = ('CCM', 'ACC', 'ACP', 'HAP', 'DCPD', 'OCP', 'struv', 'newb', 'magn', 'kstruv', 'FeS', 'Fe3PO42', 'AlPO4')
 
 def rhos_madm1(state_arr, params, T_op, h=None):
     """
@@ -813,7 +852,7 @@ def rhos_madm1(state_arr, params, T_op, h=None):
     K_so4 = params['K_so4']
     cmps = params['components']
     # n = len(cmps)
-    pH_LLs, pH_ULs = params['pH_limits']
+    pH_limits = params['pH_limits']
     KS_IN = params['KS_IN']
     KS_IP = params['KS_IP']
     KI_nh3 = params['KI_nh3']
@@ -845,7 +884,8 @@ def rhos_madm1(state_arr, params, T_op, h=None):
     rhos[:46] = ks * Cs
     primary_substrates = state_arr[:8]
     
-    rhos[3:11] *= substr_inhibit(primary_substrates, Ks[:8])
+    monod_main = substr_inhibit(primary_substrates, Ks[:8])
+    rhos[3:11] *= monod_main
     c4 = primary_substrates[[3,4]]
     if sum(c4) > 0: rhos[[6,7]] *= c4/sum(c4)
     
@@ -873,7 +913,7 @@ def rhos_madm1(state_arr, params, T_op, h=None):
     # ******************
     # Convert kg/m³ (model states) to mol/L
     # FIX: Remove extra 1e3 factor - mass2mol_conversion already converts kg/m³ to mol/L
-    unit_conversion = mass2mol_conversion(cmps)  # kg/m³ → mol/L (NOT kmol/m³!)
+    unit_conversion = _mass2mol(cmps)  # kg/m³ → mol/L (NOT kmol/m³!)
     if T_op == T_base:
         Ka = Kab
         KH = KHb / unit_conversion[[7,8,9,30]]
@@ -892,7 +932,9 @@ def rhos_madm1(state_arr, params, T_op, h=None):
             Ksp = params['Ksp'] = Kspb * T_correction_factor(T_base, T_op, Ksp_dH)
             
     S_IN, S_IP = state_arr[[10,11]]
-    I_nutrients = substr_inhibit(S_IN, KS_IN) * substr_inhibit(S_IP, KS_IP)
+    I_IN_lim = substr_inhibit(S_IN, KS_IN)
+    I_IP_lim = substr_inhibit(S_IP, KS_IP)
+    I_nutrients = I_IN_lim * I_IP_lim
     rhos[3:11] *= I_nutrients
     rhos[[25,27,29,31,32]] *= I_nutrients
     
@@ -904,7 +946,13 @@ def rhos_madm1(state_arr, params, T_op, h=None):
         pH, nh3, co2, acts = pcm(state_arr, params)
     else:
         pH, nh3, co2, acts = h
-    Is_pH = Hill_inhibit(10**(-pH), pH_ULs, pH_LLs)
+    # Hill pH inhibition in closed form: 1/(1 + 10**(n*(pH_mid - pH))), with
+    # n = 3/(UL-LL) and pH_mid = (UL+LL)/2 fixed by the pH limits (cached in params)
+    pH_hill = params.get('pH_hill')
+    if pH_hill is None or pH_hill[0] is not pH_limits:
+        pH_LLs, pH_ULs = pH_limits
+        pH_hill = params['pH_hill'] = (pH_limits, 3/(pH_ULs - pH_LLs), (pH_ULs + pH_LLs)/2)
+    Is_pH = 1/(1 + 10**(pH_hill[1]*(pH_hill[2] - pH)))
     rhos[3:9] *= Is_pH[0]
     rhos[9:11] *= Is_pH[1:3]
     rhos[[25,27]] *= Is_pH[3:5]
@@ -926,9 +974,7 @@ def rhos_madm1(state_arr, params, T_op, h=None):
     SI_dict = calc_saturation_indices(state_arr, cmps, pH, T_op, unit_conversion)
 
     # Map dict to array in correct order (matching state_arr[47:60])
-    # X_CCM, X_ACC, X_ACP, X_HAP, X_DCPD, X_OCP, X_struv, X_newb, X_magn, X_kstruv, X_FeS, X_Fe3PO42, X_AlPO4
-    mineral_names = ['CCM', 'ACC', 'ACP', 'HAP', 'DCPD', 'OCP', 'struv', 'newb', 'magn', 'kstruv', 'FeS', 'Fe3PO42', 'AlPO4']
-    SIs = np.array([SI_dict.get(name, 1.0) for name in mineral_names])
+    SIs = np.array([SI_dict.get(name, 1.0) for name in _MINERAL_NAMES])
 
     # CRITICAL FIX (per Codex review): Do NOT clamp SI at 1.0
     # That prevents dissolution (SI < 1 → negative rate)
@@ -938,7 +984,7 @@ def rhos_madm1(state_arr, params, T_op, h=None):
     # Precipitation/dissolution rate: r = k * X * sign(SI-1) * |SI^(1/ν) - 1|^n
     # n_cryst is even (2), so (SI^(1/ν) - 1)^n is always positive
     # We must explicitly preserve the sign for dissolution
-    SI_driving_force = SIs**(1/sum_stoichios) - 1  # Positive if SI > 1, negative if SI < 1
+    SI_driving_force = SIs**_inv_sum_stoichios - 1  # Positive if SI > 1, negative if SI < 1
     sign_direction = np.sign(SI_driving_force)  # +1 for precipitation, -1 for dissolution
     magnitude = np.abs(SI_driving_force)**n_cryst  # Always positive due to even n_cryst
 
@@ -979,95 +1025,116 @@ def rhos_madm1(state_arr, params, T_op, h=None):
 
     # Gas transfer rate in kg/m³/d (all terms in consistent mass units)
     # Now biogas_S includes biological supersaturation, so driving force is non-zero
-    rhos[-n_gas:] = kLa * (biogas_S - KH * biogas_p)  # kg/m³/d - FIXED to use -n_gas
+    gas_eq = KH * biogas_p
+    rhos[-n_gas:] = kLa * (biogas_S - gas_eq)  # kg/m³/d - FIXED to use -n_gas
 
     # DIAGNOSTIC HOOKS: Populate root.data for CLI diagnostics (per Codex advice)
+    # rhos_madm1 also runs inside every H2 Newton step, so only a snapshot of the
+    # raw values is kept here; root.data is built from the last one on access.
     root = params.get('root')
-
-    # DIAGNOSTIC: Print gas transfer driving force for CH4
-    if root is not None and 'diagnostics' in root.data:
-        root.data['diagnostics']['gas_transfer'] = {
-            'biogas_S_ch4_kg_m3': float(biogas_S[1]),  # CH4 dissolved
-            'KH_ch4_kg_m3_bar': float(KH[1]),
-            'biogas_p_ch4_bar': float(biogas_p[1]),
-            'KH_times_p_ch4_kg_m3': float(KH[1] * biogas_p[1]),
-            'driving_force_ch4_kg_m3': float(biogas_S[1] - KH[1] * biogas_p[1]),
-            'kLa': float(kLa),
-            'rho_ch4_kg_m3_d': float(rhos[-3])  # CH4 is second element in gas array
-        }
     if root is not None:
-        # Calculate Monod factors for diagnostics using Ks from params
-        # Primary substrates (S_su, S_aa, S_fa, S_va, S_bu, S_pro, S_ac, S_h2)
-        primary_substrates = state_arr[[0,1,2,3,4,5,6,7]]
-        Ks_main = Ks[:8]  # First 8 Ks values are for main uptake processes
-        monod_main = substr_inhibit(primary_substrates, Ks_main)
-
-        # Store comprehensive diagnostics
-        root.data = {
-            'pH': float(pH),
-            'nh3_M': float(nh3),
-            'co2_M': float(co2),
-            'h2s_M': float(Z_h2s),
-            'biogas_dissolved': {
-                'co2_kmol_m3': float(biogas_S[2]),
-                'h2s_kmol_m3': float(biogas_S[3]),
-            },
-            'gas_equilibrium': {
-                'co2_eq_kmol_m3': float((KH * biogas_p)[2]),
-                'h2s_eq_kmol_m3': float((KH * biogas_p)[3]),
-            },
-            'I_pH': {
-                'acidogens': float(Is_pH[0]),
-                'acetoclastic': float(Is_pH[1]),
-                'hydrogenotrophic': float(Is_pH[2]),
-                'SRB_h2': float(Is_pH[3]),
-                'SRB_ac': float(Is_pH[4]),
-                'SRB_aa': float(Is_pH[5]),
-            },
-            'I_h2': {
-                'LCFA': float(Is_h2[0]),
-                'C4_valerate': float(Is_h2[1]),
-                'C4_butyrate': float(Is_h2[2]),
-                'propionate': float(Is_h2[3]),
-            },
-            'I_h2s': {
-                'C4_valerate': float(Is_h2s[0]),
-                'C4_butyrate': float(Is_h2s[1]),
-                'propionate': float(Is_h2s[2]),
-                'acetate': float(Is_h2s[3]),
-                'hydrogen': float(Is_h2s[4]),
-                'SRB_h2': float(Is_h2s[5]),
-                'SRB_ac': float(Is_h2s[6]),
-                'SRB_prop': float(Is_h2s[7]),
-                'SRB_bu': float(Is_h2s[8]),
-                'SRB_va': float(Is_h2s[9]),
-            },
-            'I_nutrients': {
-                'I_IN_lim': float(substr_inhibit(S_IN, KS_IN)),
-                'I_IP_lim': float(substr_inhibit(S_IP, KS_IP)),
-                'combined': float(I_nutrients),
-                'I_nh3': float(Inh3),
-            },
-            'Monod': monod_main.tolist(),
-            'biomass_kg_m3': {
-                'X_su': float(state_arr[16]),
-                'X_aa': float(state_arr[17]),
-                'X_fa': float(state_arr[18]),
-                'X_c4': float(state_arr[19]),
-                'X_pro': float(state_arr[20]),
-                'X_ac': float(state_arr[21]),
-                'X_h2': float(state_arr[22]),
-                'X_PAO': float(state_arr[26]),
-                'X_hSRB': float(state_arr[31]),
-                'X_aSRB': float(state_arr[32]),
-                'X_pSRB': float(state_arr[33]),
-                'X_c4SRB': float(state_arr[34]),
-            },
-            'process_rates': rhos.tolist(),
-        }
+        root.record(pH, nh3, co2, Z_h2s, biogas_S, gas_eq,
+                    Is_pH, Is_h2, Is_h2s, I_IN_lim, I_IP_lim, I_nutrients, Inh3,
+                    monod_main, state_arr[:35].copy(), rhos.copy())
 
     return rhos
 
+
+def _diagnostics_dict(pH, nh3, co2, Z_h2s, biogas_S, gas_eq,
+                      Is_pH, Is_h2, Is_h2s, I_IN_lim, I_IP_lim, I_nutrients, Inh3,
+                      monod_main, state_arr, rhos):
+    """Build the ``root.data`` diagnostics dict from a rhos_madm1 snapshot."""
+    return {
+        'pH': float(pH),
+        'nh3_M': float(nh3),
+        'co2_M': float(co2),
+        'h2s_M': float(Z_h2s),
+        'biogas_dissolved': {
+            'co2_kmol_m3': float(biogas_S[2]),
+            'h2s_kmol_m3': float(biogas_S[3]),
+        },
+        'gas_equilibrium': {
+            'co2_eq_kmol_m3': float(gas_eq[2]),
+            'h2s_eq_kmol_m3': float(gas_eq[3]),
+        },
+        'I_pH': {
+            'acidogens': float(Is_pH[0]),
+            'acetoclastic': float(Is_pH[1]),
+            'hydrogenotrophic': float(Is_pH[2]),
+            'SRB_h2': float(Is_pH[3]),
+            'SRB_ac': float(Is_pH[4]),
+            'SRB_aa': float(Is_pH[5]),
+        },
+        'I_h2': {
+            'LCFA': float(Is_h2[0]),
+            'C4_valerate': float(Is_h2[1]),
+            'C4_butyrate': float(Is_h2[2]),
+            'propionate': float(Is_h2[3]),
+        },
+        'I_h2s': {
+            'C4_valerate': float(Is_h2s[0]),
+            'C4_butyrate': float(Is_h2s[1]),
+            'propionate': float(Is_h2s[2]),
+            'acetate': float(Is_h2s[3]),
+            'hydrogen': float(Is_h2s[4]),
+            'SRB_h2': float(Is_h2s[5]),
+            'SRB_ac': float(Is_h2s[6]),
+            'SRB_prop': float(Is_h2s[7]),
+            'SRB_bu': float(Is_h2s[8]),
+            'SRB_va': float(Is_h2s[9]),
+        },
+        'I_nutrients': {
+            'I_IN_lim': float(I_IN_lim),
+            'I_IP_lim': float(I_IP_lim),
+            'combined': float(I_nutrients),
+            'I_nh3': float(Inh3),
+        },
+        'Monod': monod_main.tolist(),
+        'biomass_kg_m3': {
+            'X_su': float(state_arr[16]),
+            'X_aa': float(state_arr[17]),
+            'X_fa': float(state_arr[18]),
+            'X_c4': float(state_arr[19]),
+            'X_pro': float(state_arr[20]),
+            'X_ac': float(state_arr[21]),
+            'X_h2': float(state_arr[22]),
+            'X_PAO': float(state_arr[26]),
+            'X_hSRB': float(state_arr[31]),
+            'X_aSRB': float(state_arr[32]),
+            'X_pSRB': float(state_arr[33]),
+            'X_c4SRB': float(state_arr[34]),
+        },
+        'process_rates': rhos.tolist(),
+    }
+
+
+class _DiagnosticsState:
+    """
+    Holder for ``params['root']``: stores intermediate rhos_madm1 results.
+
+    ``record()`` keeps the latest raw snapshot; ``data`` (the dict read by
+    extract_diagnostics) is built from it on first access after each record.
+    """
+
+    def __init__(self):
+        self._data = {}  # Temporary storage for solver state (dictionary)
+        self._snapshot = None
+
+    def record(self, *snapshot):
+        self._snapshot = snapshot
+
+    @property
+    def data(self):
+        if self._snapshot is not None:
+            self._data = _diagnostics_dict(*self._snapshot)
+            self._snapshot = None
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._snapshot = None
+
 #%% modified ADM1 class
 _load_components = settings.get_default_chemicals
 
@@ -1450,13 +1517,9 @@ class ModifiedADM1(CompiledProcesses):
         Ksp_base = np.array([10**(-pK) for pK in cls._pKsp_base])
         Ksp_dH = np.array(cls._Ksp_dH)
 
-        # Create TempState object for storing intermediate calculation results
-        # It needs a .data attribute that can be copied and used as a dict
-        class TempState:
-            def __init__(self):
-                self.data = {}  # Temporary storage for solver state (dictionary)
-
-        root = TempState()
+        # Diagnostics holder for storing intermediate calculation results
+        # Its .data attribute is the dict read by extract_diagnostics
+        root = _DiagnosticsState()
         dct = self.__dict__
         dct.update(kwargs)
 
@@ -137,6 +137,8 @@ class AnaerobicCSTRmADM1(AnaerobicCSTR):
         # Using 1/MW (pure molecular weight) would OVERCOUNT CH4 moles by ~4×
         # Reference: QSDsan upstream AnaerobicCSTR uses i_mass/MW (line 518, 557, 622)
         gas_mass2mol_conversion = cmps.i_mass[self._gas_cmp_idx] / cmps.chem_MW[self._gas_cmp_idx]  # kmol/kg COD
+        # Liquid-to-headspace transfer coefficients, folded once: V_liq/V_gas * (kmol/kg COD)
+        gas_transfer_coeff = V_liq / V_gas * gas_mass2mol_conversion
         hasexo = bool(len(self._exovars))
         f_exovars = self.eval_exo_dynamic_vars
         f_qgas = self.f_q_gas_fixed_P_headspace if self._fixed_P_gas else self.f_q_gas_var_P_headspace
@@ -185,7 +187,8 @@ class AnaerobicCSTRmADM1(AnaerobicCSTR):
             Q_ins = QC_ins[:, -1]
             S_ins = QC_ins[:, :-1] * 1e-3  # mg/L to kg/m3
             Q = sum(Q_ins)
-            S_in = Q_ins @ S_ins / Q
+            QS_in = Q_ins @ S_ins  # inlet mass flow, reused for S_in and the mass balance
+            S_in = QS_in / Q
 
             if hasexo:
                 exo_vars = f_exovars(t)
@@ -197,12 +200,12 @@ class AnaerobicCSTRmADM1(AnaerobicCSTR):
             rhos = _f_rhos(QC)
             S_liq = QC[:n_cmps]
             S_gas = QC[n_cmps:(n_cmps + n_gas)]
-            _dstate[:n_cmps] = (Q_ins @ S_ins - Q * S_liq * (1 - f_rtn)) / V_liq \
+            _dstate[:n_cmps] = (QS_in - Q * S_liq * (1 - f_rtn)) / V_liq \
                 + np.dot(M_stoichio(QC), rhos)
             gas_rhos = rhos[-n_gas:]
             q_gas = f_qgas(gas_rhos, S_gas, T)
             _dstate[n_cmps:(n_cmps + n_gas)] = - q_gas * S_gas / V_gas \
-                + gas_rhos * V_liq / V_gas * gas_mass2mol_conversion
+                + gas_rhos * gas_transfer_coeff
 
             # Q derivative (always at n_cmps + n_gas index)
             _dstate[n_cmps + n_gas] = 0.
@@ -382,6 +382,13 @@ def create_rate_function_with_h2s_inhibition(srb_rate_functions, base_cmps, base
     logger.info(f"Creating custom rate function with H2S inhibition on methanogens")
     logger.debug(f"S_IS index: {idx_IS}, base ADM1 components: {adm1_count}")
 
+    # CRITICAL: _rhos_adm1 mutates the dict it is given, so hand it a private
+    # copy of the captured base parameters. One copy is made here rather than
+    # one per ODE evaluation; _rhos_adm1 only writes its own cached entries.
+    base_params_local = base_params.copy()
+    if base_unit_conv is not None:
+        base_params_local['unit_conv'] = base_unit_conv
+
     def rhos_adm1_with_h2s_inhibition(state_arr, params):
         """
         Custom rate function: ADM1 (22) + H2S inhibition + SRB (3).
@@ -406,12 +413,7 @@ def create_rate_function_with_h2s_inhibition(srb_rate_functions, base_cmps, base
         # Slice state to only ADM1 components (first 27)
         state_base = state_arr[:adm1_count]
 
-        # Use the captured base ADM1 parameters (27 components)
-        # CRITICAL: Pass a copy because _rhos_adm1 mutates the dict
-        base_params_local = base_params.copy()
-        if base_unit_conv is not None:
-            base_params_local['unit_conv'] = base_unit_conv
-
+        # Use the captured base ADM1 parameters (27 components, private copy)
         rhos_base = _rhos_adm1(state_base, base_params_local)
 
         # 2. Apply H2S inhibition to methanogens
@@ -42,7 +42,8 @@ def run_simulation(
     fecl3_dose_mg_L: float = 0,
     naoh_dose_mg_L: float = 0,
     na2co3_dose_mg_L: float = 0,
-    pH_ctrl: float = None
+    pH_ctrl: float = None,
+    formatted_outputs: bool = True
 ):
     """
     Run QSDsan ADM1+sulfur simulation from JSON input files.
@@ -62,6 +63,9 @@ def run_simulation(
         fecl3_dose_mg_L: FeCl3 dose in mg/L (default 0 = no dosing)
         naoh_dose_mg_L: NaOH dose in mg/L (default 0 = no dosing)
         na2co3_dose_mg_L: Na2CO3 dose in mg/L (default 0 = no dosing)
+        formatted_outputs: Write the formatted performance/inhibition/
+            precipitation/timeseries files (default True). Batch callers
+            that only read the results file can skip them.
     """
     try:
         start_time = datetime.now()
@@ -89,7 +93,10 @@ def run_simulation(
 
         logger.info(f"Basis: Q={basis.get('Q', 'N/A')} m3/d, T={basis.get('Temp', 'N/A')} K")
         logger.info(f"ADM1 state: {len(adm1_state)} components")
-        logger.info(f"Design SRT: {heuristic_config['digester']['srt_days']} days (HRT in heuristic: {heuristic_config['digester']['hrt_days']} days)")
+        digester_config = heuristic_config['digester']
+        SRT_design = digester_config['srt_days']
+        HRT_design = digester_config['hrt_days']
+        logger.info(f"Design SRT: {SRT_design} days (HRT in heuristic: {HRT_design} days)")
 
         # Import simulation modules (this takes ~18 seconds on first run)
         logger.info("Loading QSDsan components (may take ~18 seconds)...")
@@ -171,7 +178,6 @@ def run_simulation(
                     logger.warning(f"  - {warning}")
         else:
             # Single simulation at design SRT (for CSTR, SRT = HRT, runs until convergence)
-            SRT_design = heuristic_config['digester']['srt_days']
             logger.info(f"Running single simulation at design SRT={SRT_design} days (no time limit)...")
             sys_d, inf_d, eff_d, gas_d, converged_at_d, status_d, time_series_d = run_simulation_sulfur(
                 basis, adm1_state, SRT_design,
@@ -219,13 +225,16 @@ def run_simulation(
         # Build validation section if dual-HRT was run
         validation_results = None
         if validate_hrt:
-            effluent_check = analyze_liquid_stream(eff_c)
-            biogas_check = analyze_gas_stream(gas_c, inf_c, eff_c)
-            yields_check = analyze_biomass_yields(inf_c, eff_c, system=sys_c)
+            if sys_c is sys_d:
+                # Check run reused the design results (SRT unchanged); don't re-analyze
+                biogas_check, yields_check = biogas, yields
+            else:
+                biogas_check = analyze_gas_stream(gas_c, inf_c, eff_c)
+                yields_check = analyze_biomass_yields(inf_c, eff_c, system=sys_c)
 
             validation_results = {
-                "hrt_design": heuristic_config['digester']['hrt_days'],
-                "hrt_check": heuristic_config['digester']['hrt_days'] * (1 + hrt_variation),
+                "hrt_design": HRT_design,
+                "hrt_check": HRT_design * (1 + hrt_variation),
                 "converged_at_design": converged_at_d,
                 "converged_at_check": converged_at_c,
                 "status_design": status_d,
@@ -282,6 +291,10 @@ def run_simulation(
             json.dump(result, f, indent=2)
         logger.info(f"Legacy results saved to {full_results_path} (deprecated)")
 
+        if not formatted_outputs:
+            logger.info("=== Simulation Complete (formatted outputs skipped) ===")
+            return result
+
         # Generate formatted output files
         logger.info("Generating formatted output files...")
         from utils.output_formatters import (
@@ -422,6 +435,12 @@ def main():
         default='.',
         help='Directory for all output files (default: current directory)'
     )
+    parser.add_argument(
+        '--no-formatted-outputs',
+        dest='formatted_outputs',
+        action='store_false',
+        help='Skip writing the formatted simulation_*.json files (results file only)'
+    )
 
     args = parser.parse_args()
 
@@ -438,7 +457,8 @@ def main():
         fecl3_dose_mg_L=args.fecl3_dose,
         naoh_dose_mg_L=args.naoh_dose,
         na2co3_dose_mg_L=args.na2co3_dose,
-        pH_ctrl=args.pH_ctrl
+        pH_ctrl=args.pH_ctrl,
+        formatted_outputs=args.formatted_outputs
     )
 
     # Exit with appropriate code
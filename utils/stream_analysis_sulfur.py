@@ -24,11 +24,20 @@ from utils.qsdsan_sulfur_kinetics import H2S_INHIBITION
 
 logger = logging.getLogger(__name__)
 
+# PCM equilibrium pH solver (resolved once; per-stream fallback is the stream's own pH)
+try:
+    from utils.codex_validator import qsdsan_equilibrium_ph
+except ImportError:
+    logger.warning("PCM equilibrium pH solver not available. Using stream pH values.")
+    qsdsan_equilibrium_ph = None
+
 # Constants for gas calculations
 _HOURS_PER_DAY = 24.0
 # Ideal molar volume at standard conditions (0 °C, 1 atm); aligns with ADM1 stoichiometry.
 _STD_MOLAR_VOLUME_M3_PER_KMOL = 22.414
 _SULFUR_MOLAR_MASS_KG_PER_KMOL = 32.065  # kg S per kmol
+# kmol/hr → Nm³/d at STP, folded into one factor
+_KMOL_PER_HR_TO_NM3_PER_D = _STD_MOLAR_VOLUME_M3_PER_KMOL * _HOURS_PER_DAY
 
 
 def safe_get(stream, attr, default=None):
@@ -42,7 +51,7 @@ def safe_composite(stream, param, **kwargs):
         if hasattr(stream, 'composite'):
             return stream.composite(param, **kwargs)
         return None
-    except:
+    except Exception:
         return None
 
 
@@ -78,7 +87,7 @@ def get_component_conc_kg_m3(stream, component_id):
             return stream.imass[component_id] / stream.F_vol
         else:
             return 0.0
-    except:
+    except Exception:
         return None
 
 
@@ -134,9 +143,10 @@ def _calculate_stream_ph(stream):
     if not hasattr(stream, 'F_vol') or stream.F_vol <= 0:
         return 7.0
 
-    try:
-        from utils.codex_validator import qsdsan_equilibrium_ph
+    if qsdsan_equilibrium_ph is None:
+        return round(float(getattr(stream, '_pH', 7.0)), 2)
 
+    try:
         # Convert stream mass flows (kg/hr) to concentrations (kg/m³)
         F_vol = stream.F_vol
         adm1_state = {}
@@ -168,22 +178,25 @@ def _analyze_liquid_stream_core(stream, include_components=False):
 
         result = {
             "success": True,
-            "flow": stream.F_vol * 24 if hasattr(stream, 'F_vol') else 0,  # m3/d
-            "temperature": stream.T if hasattr(stream, 'T') else 308.15,
+            "flow": getattr(stream, 'F_vol', 0) * 24,  # m3/d
+            "temperature": getattr(stream, 'T', 308.15),
             "pH": calculated_ph,  # Gas-independent charge balance pH
-            "COD": stream.COD if hasattr(stream, 'COD') else 0,  # mg/L
+            "COD": getattr(stream, 'COD', 0),  # mg/L
             "TSS": stream.get_TSS() if hasattr(stream, 'get_TSS') else 0,
             "VSS": stream.get_VSS() if hasattr(stream, 'get_VSS') else 0,
-            "TKN": stream.TKN if hasattr(stream, 'TKN') else 0,
+            "TKN": getattr(stream, 'TKN', 0),
             "TP": safe_composite(stream, 'P') if hasattr(stream, 'composite') else 0,
-            "alkalinity": stream.SAlk * 50 if hasattr(stream, 'SAlk') else 0  # meq/L to mg/L as CaCO3
+            "alkalinity": getattr(stream, 'SAlk', 0) * 50  # meq/L to mg/L as CaCO3
         }
 
         if include_components:
             # Include all 30 components (27 ADM1 + 3 sulfur)
-            result["components"] = {}
-            for comp_id in stream.components.IDs:
-                result["components"][comp_id] = get_component_conc_mg_L(stream, comp_id)
+            # Pair the component IDs with the stream's mg/L concentration array
+            # in one pass instead of an imass lookup per component.
+            if stream.F_vol > 0:
+                result["components"] = dict(zip(stream.components.IDs, stream.conc.tolist()))
+            else:
+                result["components"] = dict.fromkeys(stream.components.IDs, 0.0)
 
         return result
 
@@ -205,25 +218,27 @@ def _analyze_gas_stream_core(stream):
     """
     try:
         # FIX #3: Use molar flow and STP conversion (Codex analysis 2025-10-24)
-        # Standard molar volume at STP: 22.414 L/mol = 0.022414 m³/mol
-        STP_MOLAR_VOLUME = 22.414  # L/mol at STP (0°C, 1 atm)
+        # Standard molar volume at STP: 22.414 L/mol = 22.414 m³/kmol
 
         # Get component molar flows (kmol/hr)
-        if stream.F_mol > 0:
-            ch4_mol = stream.imol['S_ch4'] if 'S_ch4' in stream.components.IDs else 0  # kmol/hr
-            co2_mol = stream.imol['S_IC'] if 'S_IC' in stream.components.IDs else 0   # kmol/hr
-            h2_mol = stream.imol['S_h2'] if 'S_h2' in stream.components.IDs else 0    # kmol/hr
-
-            # Convert kmol/hr → mol/hr → L/hr → m³/hr → m³/d at STP
-            ch4_flow = ch4_mol * 1000 * STP_MOLAR_VOLUME / 1000 * 24  # Nm³/d
-            co2_flow = co2_mol * 1000 * STP_MOLAR_VOLUME / 1000 * 24  # Nm³/d
-            h2_flow = h2_mol * 1000 * STP_MOLAR_VOLUME / 1000 * 24   # Nm³/d
+        F_mol = stream.F_mol
+        if F_mol > 0:
+            ids = stream.components.IDs
+            imol = stream.imol
+            ch4_mol = imol['S_ch4'] if 'S_ch4' in ids else 0  # kmol/hr
+            co2_mol = imol['S_IC'] if 'S_IC' in ids else 0   # kmol/hr
+            h2_mol = imol['S_h2'] if 'S_h2' in ids else 0    # kmol/hr
+
+            # Convert kmol/hr → m³/hr → m³/d at STP
+            ch4_flow = ch4_mol * _KMOL_PER_HR_TO_NM3_PER_D  # Nm³/d
+            co2_flow = co2_mol * _KMOL_PER_HR_TO_NM3_PER_D  # Nm³/d
+            h2_flow = h2_mol * _KMOL_PER_HR_TO_NM3_PER_D    # Nm³/d
             flow_total = ch4_flow + co2_flow + h2_flow  # Nm³/d
 
-            # Calculate percentages
-            ch4_frac = stream.imol['S_ch4'] / stream.F_mol if 'S_ch4' in stream.components.IDs else 0
-            co2_frac = stream.imol['S_IC'] / stream.F_mol if 'S_IC' in stream.components.IDs else 0
-            h2_frac = stream.imol['S_h2'] / stream.F_mol if 'S_h2' in stream.components.IDs else 0
+            # Calculate percentages (reuse the molar flows read above)
+            ch4_frac = ch4_mol / F_mol
+            co2_frac = co2_mol / F_mol
+            h2_frac = h2_mol / F_mol
         else:
             ch4_flow = co2_flow = h2_flow = flow_total = 0
             ch4_frac = co2_frac = h2_frac = 0
@@ -277,7 +292,8 @@ def analyze_biomass_yields(inf_stream, eff_stream, system=None, diagnostics=None
     """
     try:
         # COD removal efficiency
-        cod_removal = (1 - eff_stream.COD / inf_stream.COD) * 100 if inf_stream.COD > 0 else 0
+        cod_in = inf_stream.COD
+        cod_removal = (1 - eff_stream.COD / cod_in) * 100 if cod_in > 0 else 0
 
         # System object is REQUIRED for correct yield calculation
         if system is None:
@@ -413,8 +429,11 @@ def calculate_h2s_speciation(S_IS_total, pH, temperature_K=308.15, input_units='
     H2S_dissolved_kg_m3 = S_IS_total_kg_m3 * fraction_H2S
     HS_dissolved_kg_m3 = S_IS_total_kg_m3 * fraction_HS
 
-    logger.debug(f"H2S speciation at pH={pH:.2f}: {fraction_H2S*100:.1f}% H2S, {fraction_HS*100:.1f}% HS⁻")
-    logger.debug(f"H2S concentration: {H2S_dissolved_kg_m3:.6f} kg S/m³ ({H2S_dissolved_kg_m3*1000:.4f} mg S/L)")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("H2S speciation at pH=%.2f: %.1f%% H2S, %.1f%% HS⁻",
+                     pH, fraction_H2S * 100, fraction_HS * 100)
+        logger.debug("H2S concentration: %.6f kg S/m³ (%.4f mg S/L)",
+                     H2S_dissolved_kg_m3, H2S_dissolved_kg_m3 * 1000)
 
     return {
         'H2S_dissolved_kg_m3': H2S_dissolved_kg_m3,  # For inhibition calculations!
@@ -458,12 +477,8 @@ def calculate_h2s_gas_ppm(gas_stream):
         if total_mol_hr <= 0:
             return 0.0
 
-        try:
-            h2s_mol_hr = gas_stream.imol['S_IS']
-        except Exception:
-            # If the component is present but mol flow is inaccessible, assume zero
-            h2s_mol_hr = 0.0
-
+        # S_IS membership is checked above, so the keyed read cannot miss
+        h2s_mol_hr = gas_stream.imol['S_IS']
         if h2s_mol_hr <= 0:
             return 0.0
 
@@ -577,26 +592,19 @@ def calculate_sulfur_metrics(inf, eff, gas):
         if S_SO4_in_mg_L and S_SO4_in_mg_L > 1e-6:
             sulfate_removal = (1 - S_SO4_out_mg_L/S_SO4_in_mg_L) * 100
 
-        # Calculate mass flows (kg S/d) from concentrations and flow rates
-        Q_inf_m3_d = inf.F_vol * _HOURS_PER_DAY  # m3/d
-        Q_eff_m3_d = eff.F_vol * _HOURS_PER_DAY  # m3/d
-        gas_mol_hr = getattr(gas, 'F_mol', 0.0)
-        Q_gas_m3_d = gas_mol_hr * _STD_MOLAR_VOLUME_M3_PER_KMOL * _HOURS_PER_DAY  # Nm3/d
-
         # Mass flows: concentration (mg S/L) * flow (m3/d) * (1 kg / 1e6 mg) * (1000 L / m3)
         # Simplifies to: concentration (mg S/L) * flow (m3/d) / 1000 = kg S/d
-        sulfate_in_kg_S_d = (S_SO4_in_mg_L * Q_inf_m3_d / 1000) if S_SO4_in_mg_L else 0.0
-        sulfate_out_kg_S_d = (S_SO4_out_mg_L * Q_eff_m3_d / 1000) if S_SO4_out_mg_L else 0.0
-        sulfide_out_kg_S_d = (S_IS_total_mg_L * Q_eff_m3_d / 1000) if S_IS_total_mg_L else 0.0
+        # Fold flow (m3/hr → m3/d) and the /1000 into one factor per stream
+        inf_kg_d_per_mg_L = inf.F_vol * _HOURS_PER_DAY / 1000
+        eff_kg_d_per_mg_L = eff.F_vol * _HOURS_PER_DAY / 1000
+        sulfate_in_kg_S_d = (S_SO4_in_mg_L * inf_kg_d_per_mg_L) if S_SO4_in_mg_L else 0.0
+        sulfate_out_kg_S_d = (S_SO4_out_mg_L * eff_kg_d_per_mg_L) if S_SO4_out_mg_L else 0.0
+        sulfide_out_kg_S_d = (S_IS_total_mg_L * eff_kg_d_per_mg_L) if S_IS_total_mg_L else 0.0
 
         # H2S in biogas: use gas stream S_IS mass flow directly
         # gas.imass['S_IS'] is already in kg/hr, convert to kg/d
         if hasattr(gas, 'imol') and 'S_IS' in gas.components.IDs:
-            try:
-                h2s_mol_hr = gas.imol['S_IS']
-            except Exception:
-                h2s_mol_hr = 0.0
-            h2s_biogas_kg_S_d = h2s_mol_hr * _SULFUR_MOLAR_MASS_KG_PER_KMOL * _HOURS_PER_DAY
+            h2s_biogas_kg_S_d = gas.imol['S_IS'] * _SULFUR_MOLAR_MASS_KG_PER_KMOL * _HOURS_PER_DAY
         else:
             h2s_biogas_kg_S_d = 0.0
 
@@ -643,10 +651,11 @@ def calculate_sulfur_metrics(inf, eff, gas):
             "h2s_mg_per_L": speciation['H2S_dissolved_mg_L']  # Use speciation result
         }
 
-        # 4. SRB performance
+        # 4. SRB performance (yield computed once; it evaluates both streams' COD)
+        srb_yield = calculate_srb_yield(inf, eff)
         srb_performance = {
             "biomass_conc": X_SRB if X_SRB else 0.0,  # mg COD/L
-            "yield": calculate_srb_yield(inf, eff)
+            "yield": srb_yield
         }
 
         # 5. H2S inhibition on methanogens
@@ -714,7 +723,7 @@ def calculate_sulfur_metrics(inf, eff, gas):
 
             # SRB performance
             "srb_biomass_mg_COD_L": X_SRB if X_SRB else 0.0,
-            "srb_yield_kg_VSS_per_kg_COD": calculate_srb_yield(inf, eff),
+            "srb_yield_kg_VSS_per_kg_COD": srb_yield,
 
             # H2S inhibition on methanogens
             "inhibition_acetoclastic_pct": inhibition_pct_ac,
@@ -758,15 +767,42 @@ PRECIPITATE_COMPONENTS = [
     'X_HFO_HP', 'X_HFO_LP', 'X_HFO_HP_old', 'X_HFO_LP_old'
 ]
 
+# Hashed views for membership tests (the lists above keep reporting order)
+_BIOMASS_COMPONENT_SET = frozenset(BIOMASS_COMPONENTS)
+_PRECIPITATE_COMPONENT_SET = frozenset(PRECIPITATE_COMPONENTS)
+
+# Precipitation processes are at indices 46-58 (13 processes)
+# Corresponding to ModifiedADM1._precipitates list
+# From utils/qsdsan_madm1.py:1068-1069:
+# _precipitates = ('X_CCM', 'X_ACC', 'X_ACP', 'X_HAP', 'X_DCPD', 'X_OCP',
+#                  'X_struv', 'X_newb', 'X_magn', 'X_kstruv',
+#                  'X_FeS', 'X_Fe3PO42', 'X_AlPO4')
+PRECIP_START_IDX = 46
+PRECIP_END_IDX = 59  # Exclusive
+
+# Mapping from process index to component ID
+PRECIP_COMPONENTS_ORDERED = (
+    'X_CCM', 'X_ACC', 'X_ACP', 'X_HAP', 'X_DCPD', 'X_OCP',
+    'X_struv', 'X_newb', 'X_magn', 'X_kstruv',
+    'X_FeS', 'X_Fe3PO42', 'X_AlPO4'
+)
+PRECIP_PROCESS_INDEX = tuple(enumerate(PRECIP_COMPONENTS_ORDERED, PRECIP_START_IDX))
+
 
 def is_biomass_component(component_id):
     """Check if component is an active biomass group."""
-    return component_id in BIOMASS_COMPONENTS
+    return component_id in _BIOMASS_COMPONENT_SET
 
 
 def is_precipitate_component(component_id):
     """Check if component is an inorganic precipitate."""
-    return component_id in PRECIPITATE_COMPONENTS
+    return component_id in _PRECIPITATE_COMPONENT_SET
+
+
+def _get_component_attr(stream, component_id, attr):
+    """Resolve ``stream.components.<component_id>.<attr>`` in one pass, or None."""
+    cmp = getattr(getattr(stream, 'components', None), component_id, None)
+    return getattr(cmp, attr, None)
 
 
 def get_component_i_mass(stream, component_id):
@@ -776,12 +812,9 @@ def get_component_i_mass(stream, component_id):
     Returns 0.0 if component not found or property not available.
     """
     try:
-        if hasattr(stream, 'components'):
-            cmps = stream.components
-            if hasattr(cmps, component_id):
-                cmp = getattr(cmps, component_id)
-                if hasattr(cmp, 'i_mass'):
-                    return float(cmp.i_mass)
+        i_mass = _get_component_attr(stream, component_id, 'i_mass')
+        if i_mass is not None:
+            return float(i_mass)
     except Exception as e:
         logger.debug(f"Could not get i_mass for {component_id}: {e}")
     return 0.0
@@ -794,12 +827,9 @@ def get_component_f_vmass(stream, component_id):
     Returns 0.0 for inorganic precipitates, typical value (0.85) for biomass if not available.
     """
     try:
-        if hasattr(stream, 'components'):
-            cmps = stream.components
-            if hasattr(cmps, component_id):
-                cmp = getattr(cmps, component_id)
-                if hasattr(cmp, 'f_Vmass_Totmass'):
-                    return float(cmp.f_Vmass_Totmass)
+        f_vmass = _get_component_attr(stream, component_id, 'f_Vmass_Totmass')
+        if f_vmass is not None:
+            return float(f_vmass)
 
         # Fallback: inorganic precipitates have f_V = 0, biomass typically ~0.85
         if is_precipitate_component(component_id):
@@ -813,6 +843,62 @@ def get_component_f_vmass(stream, component_id):
     return 0.85 if is_biomass_component(component_id) else 0.0
 
 
+def _find_ad_reactor(system):
+    """Return the anaerobic digester unit (ID='AD') of ``system``, or None."""
+    return next((unit for unit in system.units if getattr(unit, 'ID', None) == 'AD'), None)
+
+
+def _calculate_precipitate_formation(process_rates, V_liq, eff_stream):
+    """
+    Precipitate formation rates from mADM1 process rates (private helper).
+
+    Used internally by calculate_net_biomass_yields().
+
+    Parameters
+    ----------
+    process_rates : array-like
+        Process rates from extract_diagnostics (kg/m³/d)
+    V_liq : float
+        Reactor liquid volume (m³)
+    eff_stream : WasteStream
+        Effluent stream (for reference precipitate concentrations)
+
+    Returns
+    -------
+    tuple
+        (precipitate_data, total_precip_kg_d) for active precipitates only
+    """
+    precipitate_data = {}
+    total_precip_kg_d = 0.0
+
+    if len(process_rates) < PRECIP_END_IDX:
+        logger.warning(f"Process rates array too short ({len(process_rates)}), cannot extract precipitation rates")
+        return precipitate_data, total_precip_kg_d
+
+    for process_idx, precip_id in PRECIP_PROCESS_INDEX:
+        # Get precipitation rate (kg/m³/d)
+        rate_kg_m3_d = process_rates[process_idx]
+
+        # Convert to kg/d using liquid volume
+        formation_kg_d = rate_kg_m3_d * V_liq
+
+        if abs(formation_kg_d) > 1e-6:  # Only report active precipitation
+            # Get effluent concentration for reference
+            precip_conc_out = get_component_conc_kg_m3(eff_stream, precip_id) or 0.0
+
+            # Precipitates are reported directly in mass (no COD conversion)
+            precipitate_data[precip_id] = {
+                "formation_kg_d": formation_kg_d,
+                "formation_kg_TSS_d": formation_kg_d,  # For inorganics, mass = TSS
+                "rate_kg_m3_d": rate_kg_m3_d,
+                "concentration_out_kg_m3": precip_conc_out
+            }
+
+            total_precip_kg_d += formation_kg_d
+
+    return precipitate_data, total_precip_kg_d
+
+
 def calculate_net_biomass_yields(system, inf_stream, eff_stream, diagnostics=None):
     """
     Calculate net biomass yields and precipitate formation following QSDsan methodology.
@@ -877,11 +963,7 @@ def calculate_net_biomass_yields(system, inf_stream, eff_stream, diagnostics=Non
         biomass_conc = diagnostics.get('biomass_kg_m3', {})
 
         # Get reactor volume from system
-        ad_reactor = None
-        for unit in system.units:
-            if hasattr(unit, 'ID') and unit.ID == 'AD':
-                ad_reactor = unit
-                break
+        ad_reactor = _find_ad_reactor(system)
 
         if ad_reactor is None:
             return {
@@ -889,14 +971,15 @@ def calculate_net_biomass_yields(system, inf_stream, eff_stream, diagnostics=Non
                 "message": "Anaerobic digester reactor not found in system"
             }
 
-        V_liq = ad_reactor.V_liq if hasattr(ad_reactor, 'V_liq') else 10000.0  # m³
+        V_liq = getattr(ad_reactor, 'V_liq', 10000.0)  # m³
 
         # Calculate COD removed
-        COD_in = inf_stream.COD if hasattr(inf_stream, 'COD') else 0.0
-        COD_out = eff_stream.COD if hasattr(eff_stream, 'COD') else 0.0
+        COD_in = getattr(inf_stream, 'COD', 0.0)
+        COD_out = getattr(eff_stream, 'COD', 0.0)
         COD_removed_mg_L = COD_in - COD_out
 
-        Q = inf_stream.F_vol * 24 if hasattr(inf_stream, 'F_vol') else 1000.0  # m³/d
+        F_vol = getattr(inf_stream, 'F_vol', None)
+        Q = F_vol * 24 if F_vol is not None else 1000.0  # m³/d
         COD_removed_kg_d = COD_removed_mg_L * Q / 1000.0  # mg/L × m³/d → kg/d
 
         if COD_removed_kg_d < 1e-6:
@@ -904,6 +987,8 @@ def calculate_net_biomass_yields(system, inf_stream, eff_stream, diagnostics=Non
                 "success": False,
                 "message": "No COD removal - cannot calculate yields"
             }
+        # Guarded above, so every yield below can multiply by the reciprocal
+        inv_COD_removed_kg_d = 1.0 / COD_removed_kg_d
 
         # Initialize results
         per_group_yields = {}
@@ -911,7 +996,7 @@ def calculate_net_biomass_yields(system, inf_stream, eff_stream, diagnostics=Non
         total_biomass_TSS_kg_d = 0.0
 
         # Get model and stoichiometry matrix for M@r calculation (upstream QSDsan method)
-        model = ad_reactor.model if hasattr(ad_reactor, 'model') else None
+        model = getattr(ad_reactor, 'model', None)
         process_rates = diagnostics.get('process_rates', [])
 
         # Use stoichiometric matrix approach: prod_rates = M.T @ process_rates
@@ -926,6 +1011,12 @@ def calculate_net_biomass_yields(system, inf_stream, eff_stream, diagnostics=Non
             except Exception as e:
                 logger.warning(f"Could not compute M@r for biomass yields: {e}")
 
+        # Component ID -> index, built once instead of a list lookup per group
+        cmp_index = {}
+        if component_production_rates is not None:
+            cmp_index = {cmp_id: i for i, cmp_id in enumerate(eff_stream.components.IDs)}
+            n_rates = len(component_production_rates)
+
         # Calculate yields for each biomass functional group
         for biomass_id in BIOMASS_COMPONENTS:
             # Get biomass concentration (kg COD/m³)
@@ -933,14 +1024,13 @@ def calculate_net_biomass_yields(system, inf_stream, eff_stream, diagnostics=Non
 
             # Net production (kg COD/d) using M@r approach (QSDsan methodology)
             if component_production_rates is not None:
-                try:
-                    # Get component index
-                    cmp_idx = list(eff_stream.components.IDs).index(biomass_id)
+                cmp_idx = cmp_index.get(biomass_id)
+                if cmp_idx is not None and cmp_idx < n_rates:
                     prod_rate_kg_m3_d = component_production_rates[cmp_idx]
                     # Only count positive production (net growth, not decay)
                     net_production_cod_kg_d = max(0.0, prod_rate_kg_m3_d * V_liq)
-                except (ValueError, IndexError):
-                    # Component not found or index error - fall back to zero
+                else:
+                    # Component not found - fall back to zero
                     net_production_cod_kg_d = 0.0
             else:
                 # Fallback: if M@r failed, use zero (better than wrong washout estimate)
@@ -957,7 +1047,7 @@ def calculate_net_biomass_yields(system, inf_stream, eff_stream, diagnostics=Non
             net_production_tss_kg_d = net_production_cod_kg_d * i_mass
 
             # Yield (kg VSS per kg COD removed)
-            yield_vss = net_production_vss_kg_d / COD_removed_kg_d if COD_removed_kg_d > 0 else 0.0
+            yield_vss = net_production_vss_kg_d * inv_COD_removed_kg_d
 
             per_group_yields[biomass_id] = {
                 "yield_kg_VSS_per_kg_COD": yield_vss,
@@ -970,64 +1060,17 @@ def calculate_net_biomass_yields(system, inf_stream, eff_stream, diagnostics=Non
             total_biomass_TSS_kg_d += net_production_tss_kg_d
 
         # Calculate precipitate formation from process rates (QSDsan methodology)
-        # Precipitation processes are at indices 46-58 (13 processes)
-        # Corresponding to ModifiedADM1._precipitates list
-        precipitate_data = {}
-        total_precip_kg_d = 0.0
-        total_precip_tss_kg_d = 0.0
-
-        # Get process rates from diagnostics
-        process_rates = diagnostics.get('process_rates', [])
-
-        # Define precipitation process indices and corresponding component IDs
-        # From utils/qsdsan_madm1.py:1068-1069:
-        # _precipitates = ('X_CCM', 'X_ACC', 'X_ACP', 'X_HAP', 'X_DCPD', 'X_OCP',
-        #                  'X_struv', 'X_newb', 'X_magn', 'X_kstruv',
-        #                  'X_FeS', 'X_Fe3PO42', 'X_AlPO4')
-        # Process indices: 46-58 (13 total)
-        PRECIP_START_IDX = 46
-        PRECIP_END_IDX = 59  # Exclusive
-
-        # Mapping from process index to component ID
-        PRECIP_COMPONENTS_ORDERED = [
-            'X_CCM', 'X_ACC', 'X_ACP', 'X_HAP', 'X_DCPD', 'X_OCP',
-            'X_struv', 'X_newb', 'X_magn', 'X_kstruv',
-            'X_FeS', 'X_Fe3PO42', 'X_AlPO4'
-        ]
-
-        if len(process_rates) >= PRECIP_END_IDX:
-            for i, precip_id in enumerate(PRECIP_COMPONENTS_ORDERED):
-                process_idx = PRECIP_START_IDX + i
-
-                # Get precipitation rate (kg/m³/d)
-                rate_kg_m3_d = process_rates[process_idx]
-
-                # Convert to kg/d using liquid volume
-                formation_kg_d = rate_kg_m3_d * V_liq
-
-                if abs(formation_kg_d) > 1e-6:  # Only report active precipitation
-                    # Get effluent concentration for reference
-                    precip_conc_out = get_component_conc_kg_m3(eff_stream, precip_id) or 0.0
-
-                    # Precipitates are reported directly in mass (no COD conversion)
-                    # TSS contribution equals mass (inorganics have i_COD=0)
-                    precipitate_data[precip_id] = {
-                        "formation_kg_d": formation_kg_d,
-                        "formation_kg_TSS_d": formation_kg_d,  # For inorganics, mass = TSS
-                        "rate_kg_m3_d": rate_kg_m3_d,
-                        "concentration_out_kg_m3": precip_conc_out
-                    }
-
-                    total_precip_kg_d += formation_kg_d
-                    total_precip_tss_kg_d += formation_kg_d
-        else:
-            logger.warning(f"Process rates array too short ({len(process_rates)}), cannot extract precipitation rates")
+        precipitate_data, total_precip_kg_d = _calculate_precipitate_formation(
+            process_rates, V_liq, eff_stream
+        )
+        # TSS contribution equals mass (inorganics have i_COD=0)
+        total_precip_tss_kg_d = total_precip_kg_d
 
         # Calculate overall yields
-        overall_VSS_yield = total_biomass_VSS_kg_d / COD_removed_kg_d if COD_removed_kg_d > 0 else 0.0
-        overall_TSS_yield = (total_biomass_TSS_kg_d + total_precip_tss_kg_d) / COD_removed_kg_d if COD_removed_kg_d > 0 else 0.0
-        biomass_TSS_yield = total_biomass_TSS_kg_d / COD_removed_kg_d if COD_removed_kg_d > 0 else 0.0
-        precipitate_TSS_yield = total_precip_tss_kg_d / COD_removed_kg_d if COD_removed_kg_d > 0 else 0.0
+        overall_VSS_yield = total_biomass_VSS_kg_d * inv_COD_removed_kg_d
+        biomass_TSS_yield = total_biomass_TSS_kg_d * inv_COD_removed_kg_d
+        precipitate_TSS_yield = total_precip_tss_kg_d * inv_COD_removed_kg_d
+        overall_TSS_yield = biomass_TSS_yield + precipitate_TSS_yield
 
         logger.info(f"Biomass yields calculated: VSS={overall_VSS_yield:.4f}, TSS={overall_TSS_yield:.4f} kg/kg COD")
         logger.info(f"Precipitate formation: {total_precip_kg_d:.2f} kg/d ({len(precipitate_data)} species active)")
@@ -1347,7 +1390,7 @@ def analyze_inhibition(sim_results, speciation=None):
         # Return base inhibition if extension fails
         try:
             return _analyze_inhibition_core(sim_results)
-        except:
+        except Exception:
             return {
                 "success": False,
                 "message": f"Error in inhibition analysis: {e}"
@@ -1459,11 +1502,7 @@ def extract_diagnostics(system):
     """
     try:
         # Find the anaerobic digester reactor
-        ad_reactor = None
-        for unit in system.units:
-            if hasattr(unit, 'ID') and unit.ID == 'AD':
-                ad_reactor = unit
-                break
+        ad_reactor = _find_ad_reactor(system)
 
         if ad_reactor is None:
             return {
@@ -1471,33 +1510,30 @@ def extract_diagnostics(system):
                 "message": "Anaerobic digester reactor (ID='AD') not found in system"
             }
 
-        # Access the mADM1 model
-        if not hasattr(ad_reactor, 'model'):
+        # Access the mADM1 model (getattr with a default: one lookup per level)
+        model = getattr(ad_reactor, 'model', None)
+        if model is None:
             return {
                 "success": False,
                 "message": "Reactor does not have a 'model' attribute"
             }
 
-        model = ad_reactor.model
-
         # Access rate function parameters
-        if not hasattr(model, 'rate_function'):
+        rate_function = getattr(model, 'rate_function', None)
+        if rate_function is None:
             return {
                 "success": False,
                 "message": "Model does not have a 'rate_function' attribute"
             }
 
-        rate_function = model.rate_function
-
         # Get params dictionary
-        if not hasattr(rate_function, 'params'):
+        params = getattr(rate_function, 'params', None)
+        if params is None:
             return {
                 "success": False,
                 "message": "Rate function does not have 'params' attribute"
             }
 
-        params = rate_function.params
-
         # Get root object
         root = params.get('root')
         if root is None:
@@ -1507,15 +1543,13 @@ def extract_diagnostics(system):
             }
 
         # Get diagnostic data
-        if not hasattr(root, 'data'):
+        diagnostic_data = getattr(root, 'data', None)
+        if diagnostic_data is None:
             return {
                 "success": False,
                 "message": "root.data not found - diagnostic data not populated during simulation"
             }
 
-        # Extract and return diagnostic data
-        diagnostic_data = root.data
-
         # Validate that it has expected structure
         if not isinstance(diagnostic_data, dict):
             return {
@@ -1545,10 +1579,12 @@ def extract_diagnostics(system):
             "process_rates": diagnostic_data.get('process_rates', [])
         }
 
-        logger.info("Successfully extracted diagnostic data from mADM1 simulation")
-        logger.info(f"  pH: {result['speciation']['pH']:.2f}")
-        logger.info(f"  Biomass groups: {len(result['biomass_kg_m3'])} functional groups")
-        logger.info(f"  Process rates: {len(result['process_rates'])} processes tracked")
+        if logger.isEnabledFor(logging.INFO):
+            pH = result['speciation']['pH']
+            logger.info("Successfully extracted diagnostic data from mADM1 simulation")
+            logger.info("  pH: %s", f"{pH:.2f}" if pH is not None else "n/a")
+            logger.info("  Biomass groups: %d functional groups", len(result['biomass_kg_m3']))
+            logger.info("  Process rates: %d processes tracked", len(result['process_rates']))
 
         return result
 
@@ -35,12 +35,12 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def validate_adm1_state_sync(adm1_state: dict, user_parameters: dict, tolerance: float, temperature_k: float) -> dict:
+def _build_influent_stream(adm1_state: dict, temperature_k: float):
     """
-    Direct validation using QSDsan WasteStream.
+    Build a 1 m3/hr WasteStream carrying the ADM1 state concentrations.
 
-    Computes bulk composites (COD, TSS, VSS, TKN, TP) from ADM1 components
-    and compares to target values.
+    Shared by the validate and composites commands so the component set
+    is created and registered in one place.
     """
     logger.info("Loading QSDsan components...")
     from utils.extract_qsdsan_sulfur_components import create_adm1_sulfur_cmps, set_global_components
@@ -50,23 +50,28 @@ def validate_adm1_state_sync(adm1_state: dict, user_parameters: dict, tolerance:
     cmps = create_adm1_sulfur_cmps()
     set_global_components(cmps)
 
-    logger.info("Building WasteStream from ADM1 state...")
-    # Build concentration dict - component IDs include the S_/X_ prefix
-    conc_dict = {}
-    cmp_ids = [c.ID for c in cmps]
-    for key, value in adm1_state.items():
-        if key.startswith(('S_', 'X_')):
-            # Component IDs in QSDan include the full prefix (e.g., 'S_su', not 'su')
-            if key in cmp_ids:
-                conc_dict[key] = value  # kg/m3
-
-    # Create WasteStream and compute composites
+    # Component IDs in QSDsan include the full prefix (e.g., 'S_su', not 'su')
+    cmp_ids = frozenset(ID for ID in cmps.IDs if ID.startswith(('S_', 'X_')))
+    conc_dict = {key: value for key, value in adm1_state.items() if key in cmp_ids}  # kg/m3
+
     ws = WasteStream('influent', T=temperature_k, units='kg/hr')
     ws.set_flow_by_concentration(
         flow_tot=1.0,  # 1 m3/hr for concentration basis
         concentrations=conc_dict,
         units=('m3/hr', 'kg/m3')  # Tuple: (flow_unit, concentration_unit)
     )
+    return ws
+
+
+def validate_adm1_state_sync(adm1_state: dict, user_parameters: dict, tolerance: float, temperature_k: float) -> dict:
+    """
+    Direct validation using QSDsan WasteStream.
+
+    Computes bulk composites (COD, TSS, VSS, TKN, TP) from ADM1 components
+    and compares to target values.
+    """
+    logger.info("Building WasteStream from ADM1 state...")
+    ws = _build_influent_stream(adm1_state, temperature_k)
 
     logger.info("Computing bulk composites...")
     # Calculate composites from WasteStream
@@ -112,31 +117,8 @@ def compute_bulk_composites_sync(adm1_state: dict, temperature_k: float) -> dict
     This function creates a QSDsan WasteStream with ADM1 concentrations and
     reads the composite properties.
     """
-    logger.info("Loading QSDsan components...")
-    from utils.extract_qsdsan_sulfur_components import create_adm1_sulfur_cmps, set_global_components
-    from qsdsan import WasteStream
-
-    # Set global components
-    cmps = create_adm1_sulfur_cmps()
-    set_global_components(cmps)
-
     logger.info("Creating WasteStream from ADM1 state...")
-    # Build concentrations dict - component IDs include the S_/X_ prefix
-    conc_dict = {}
-    cmp_ids = [c.ID for c in cmps]
-    for key, value in adm1_state.items():
-        if key.startswith(('S_', 'X_')):
-            # Component IDs in QSDsan include the full prefix (e.g., 'S_su', not 'su')
-            if key in cmp_ids:
-                conc_dict[key] = value  # Already in kg/m3
-
-    # Create waste stream
-    ws = WasteStream('influent', T=temperature_k, units='kg/hr')
-    ws.set_flow_by_concentration(
-        flow_tot=1.0,  # 1 m3/hr for concentration basis
-        concentrations=conc_dict,
-        units=('m3/hr', 'kg/m3')  # Tuple: (flow_unit, concentration_unit)
-    )
+    ws = _build_influent_stream(adm1_state, temperature_k)
 
     logger.info("Computing composites...")
     # QSDsan provides COD, TN, TP as properties; TSS and VSS are methods